@@ -4,6 +4,7 @@ Requires Home Assistant 2026.3+ (Python 3.14).
 """
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Any, Final
 
@@ -22,6 +23,8 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
+from nwp500.encoding import build_reservation_entry
+
 from .const import (
     DEFAULT_TEMPERATURE_C,
     DEFAULT_TEMPERATURE_F,
@@ -31,6 +34,8 @@ from .const import (
     MIN_TEMPERATURE_C,
     MIN_TEMPERATURE_F,
     MODE_TO_DHW_ID,
+    VALID_DAYS,
+    VALID_MODES,
 )
 from .coordinator import NWP500DataUpdateCoordinator
 
@@ -46,61 +51,44 @@ VISUAL_CARD_PATH = Path(__file__).parent / "www" / "nwp500-visual-card.js"
 VISUAL_IMAGE_URL = f"/{DOMAIN}/nwp500-visual-card.png"
 VISUAL_IMAGE_PATH = Path(__file__).parent / "www" / "nwp500-visual-card.png"
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.WATER_HEATER,
     Platform.SWITCH,
     Platform.NUMBER,
-]
+)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # Service names
-SERVICE_SET_RESERVATION = "set_reservation"
-SERVICE_UPDATE_RESERVATIONS = "update_reservations"
-SERVICE_CLEAR_RESERVATIONS = "clear_reservations"
-SERVICE_REQUEST_RESERVATIONS = "request_reservations"
-SERVICE_SET_VACATION_DAYS = "set_vacation_days"
-SERVICE_CONFIGURE_TOU = "configure_tou_schedule"
-SERVICE_REQUEST_TOU = "request_tou_settings"
-SERVICE_ENABLE_DEMAND_RESPONSE = "enable_demand_response"
-SERVICE_DISABLE_DEMAND_RESPONSE = "disable_demand_response"
-SERVICE_RESET_AIR_FILTER = "reset_air_filter"
-SERVICE_SET_RECIRCULATION_MODE = "set_recirculation_mode"
-SERVICE_TRIGGER_RECIRCULATION = "trigger_recirculation"
+SERVICE_SET_RESERVATION: Final = "set_reservation"
+SERVICE_UPDATE_RESERVATIONS: Final = "update_reservations"
+SERVICE_CLEAR_RESERVATIONS: Final = "clear_reservations"
+SERVICE_REQUEST_RESERVATIONS: Final = "request_reservations"
+SERVICE_SET_VACATION_DAYS: Final = "set_vacation_days"
+SERVICE_CONFIGURE_TOU: Final = "configure_tou_schedule"
+SERVICE_REQUEST_TOU: Final = "request_tou_settings"
+SERVICE_ENABLE_DEMAND_RESPONSE: Final = "enable_demand_response"
+SERVICE_DISABLE_DEMAND_RESPONSE: Final = "disable_demand_response"
+SERVICE_RESET_AIR_FILTER: Final = "reset_air_filter"
+SERVICE_SET_RECIRCULATION_MODE: Final = "set_recirculation_mode"
+SERVICE_TRIGGER_RECIRCULATION: Final = "trigger_recirculation"
 
 # Service attributes
-ATTR_ENABLED = "enabled"
-ATTR_DAYS = "days"
-ATTR_HOUR = "hour"
-ATTR_MINUTE = "minute"
-ATTR_OP_MODE = "mode"  # Renamed to avoid conflict with HA's ATTR_MODE
-ATTR_RECIRCULATION_MODE = "mode"
-ATTR_TEMPERATURE = "temperature"
-ATTR_RESERVATIONS = "reservations"
-ATTR_PERIODS = "periods"
-
-# Valid days of the week
-VALID_DAYS = [
-    "Sunday",
-    "Monday",
-    "Tuesday",
-    "Wednesday",
-    "Thursday",
-    "Friday",
-    "Saturday",
-]
-
-# Valid operation modes for reservations
-VALID_MODES = [
-    "heat_pump",
-    "electric",
-    "energy_saver",
-    "high_demand",
-    "vacation",
-    "power_off",
-]
+ATTR_ENABLED: Final = "enabled"
+ATTR_DAYS: Final = "days"
+ATTR_HOUR: Final = "hour"
+ATTR_MINUTE: Final = "minute"
+ATTR_OP_MODE: Final = "mode"  # Renamed to avoid conflict with HA's ATTR_MODE
+ATTR_RECIRCULATION_MODE: Final = "mode"
+ATTR_TEMPERATURE: Final = "temperature"
+ATTR_RESERVATIONS: Final = "reservations"
+ATTR_PERIODS: Final = "periods"
+
+
+# Reservation modes that do not heat, so need no temperature
+_TEMPLESS_MODES: Final = frozenset({"vacation", "power_off"})
 
 
 def _reservation_slot(entry: dict[str, Any]) -> tuple[int, int, int]:
@@ -147,7 +135,7 @@ def validate_reservation_temperature(data: dict[str, Any]) -> dict[str, Any]:
     mode = data.get(ATTR_OP_MODE)
     temperature = data.get(ATTR_TEMPERATURE)
 
-    if mode not in ["vacation", "power_off"] and temperature is None:
+    if mode not in _TEMPLESS_MODES and temperature is None:
         raise vol.Invalid(f"Temperature is required for mode '{mode}'")
 
     # Note: Default temperature for modes that don't use it is handled
@@ -155,37 +143,46 @@ def validate_reservation_temperature(data: dict[str, Any]) -> dict[str, Any]:
     return data
 
 
+# Field validators shared by the service schemas below
+_TARGET_FIELDS: Final = {
+    vol.Optional(ATTR_DEVICE_ID): cv.string,
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+}
+_HAS_TARGET: Final = cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID)
+_HOUR: Final = vol.All(vol.Coerce(int), vol.Range(min=0, max=23))
+_MINUTE: Final = vol.All(vol.Coerce(int), vol.Range(min=0, max=59))
+_NON_NEGATIVE_INT: Final = vol.All(vol.Coerce(int), vol.Range(min=0))
+_WEEK_BITFIELD: Final = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=0, max=254),
+    msg="Week must be a bitfield (0-254, Sun=128..Sat=2)",
+)
+
 # Service schemas
 SERVICE_SET_RESERVATION_SCHEMA = vol.All(
     vol.Schema(
         {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            **_TARGET_FIELDS,
             vol.Required(ATTR_ENABLED): cv.boolean,
             vol.Required(ATTR_DAYS): vol.All(
                 cv.ensure_list, [vol.In(VALID_DAYS)]
             ),
-            vol.Required(ATTR_HOUR): vol.All(
-                vol.Coerce(int), vol.Range(min=0, max=23)
-            ),
-            vol.Optional(ATTR_MINUTE, default=0): vol.All(
-                vol.Coerce(int), vol.Range(min=0, max=59)
-            ),
+            vol.Required(ATTR_HOUR): _HOUR,
+            vol.Optional(ATTR_MINUTE, default=0): _MINUTE,
             vol.Required(ATTR_OP_MODE): vol.In(VALID_MODES),
             vol.Optional(ATTR_TEMPERATURE): vol.All(
                 vol.Coerce(float), vol.Range(min=0, max=200)
             ),
         }
     ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    _HAS_TARGET,
     validate_reservation_temperature,
 )
 
 SERVICE_UPDATE_RESERVATIONS_SCHEMA = vol.All(
     vol.Schema(
         {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            **_TARGET_FIELDS,
             vol.Required(ATTR_RESERVATIONS): vol.All(
                 cv.ensure_list,
                 [
@@ -194,20 +191,12 @@ SERVICE_UPDATE_RESERVATIONS_SCHEMA = vol.All(
                             vol.Required("enable"): vol.In(
                                 [1, 2], msg="Enable must be 2 (On) or 1 (Off)"
                             ),
-                            vol.Required("week"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=254),
-                                msg="Week must be a bitfield (0-254, Sun=128..Sat=2)",
-                            ),
+                            vol.Required("week"): _WEEK_BITFIELD,
                             vol.Required("hour"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=23),
-                                msg="Hour must be 0-23",
+                                _HOUR, msg="Hour must be 0-23"
                             ),
                             vol.Required("min"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=59),
-                                msg="Minute must be 0-59",
+                                _MINUTE, msg="Minute must be 0-59"
                             ),
                             vol.Required("mode"): vol.In(
                                 [1, 2, 3, 4, 5, 6],
@@ -225,7 +214,7 @@ SERVICE_UPDATE_RESERVATIONS_SCHEMA = vol.All(
             vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
         }
     ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    _HAS_TARGET,
 )
 
 SERVICE_DEVICE_SCHEMA = vol.Schema(
@@ -236,33 +225,26 @@ SERVICE_DEVICE_SCHEMA = vol.Schema(
 
 # Schema for services that target a device but also accept entity_id
 SERVICE_DEVICE_OR_ENTITY_SCHEMA = vol.All(
-    vol.Schema(
-        {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
-        }
-    ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    vol.Schema(_TARGET_FIELDS),
+    _HAS_TARGET,
 )
 
 SERVICE_SET_VACATION_DAYS_SCHEMA = vol.All(
     vol.Schema(
         {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            **_TARGET_FIELDS,
             vol.Required(ATTR_DAYS): vol.All(
                 vol.Coerce(int), vol.Range(min=1, max=30)
             ),
         }
     ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    _HAS_TARGET,
 )
 
 SERVICE_CONFIGURE_TOU_SCHEMA = vol.All(
     vol.Schema(
         {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            **_TARGET_FIELDS,
             vol.Required(ATTR_PERIODS): vol.All(
                 cv.ensure_list,
                 vol.Length(max=16),
@@ -273,35 +255,13 @@ SERVICE_CONFIGURE_TOU_SCHEMA = vol.All(
                                 vol.Coerce(int),
                                 vol.Range(min=0, max=4095),
                             ),
-                            vol.Required("week"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=254),
-                                msg="Week must be a bitfield (0-254, Sun=128..Sat=2)",
-                            ),
-                            vol.Required("start_hour"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=23),
-                            ),
-                            vol.Required("start_minute"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=59),
-                            ),
-                            vol.Required("end_hour"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=23),
-                            ),
-                            vol.Required("end_minute"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0, max=59),
-                            ),
-                            vol.Required("price_min"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0),
-                            ),
-                            vol.Required("price_max"): vol.All(
-                                vol.Coerce(int),
-                                vol.Range(min=0),
-                            ),
+                            vol.Required("week"): _WEEK_BITFIELD,
+                            vol.Required("start_hour"): _HOUR,
+                            vol.Required("start_minute"): _MINUTE,
+                            vol.Required("end_hour"): _HOUR,
+                            vol.Required("end_minute"): _MINUTE,
+                            vol.Required("price_min"): _NON_NEGATIVE_INT,
+                            vol.Required("price_max"): _NON_NEGATIVE_INT,
                             vol.Required("decimal_point"): vol.All(
                                 vol.Coerce(int),
                                 vol.Range(min=0, max=10),
@@ -313,30 +273,22 @@ SERVICE_CONFIGURE_TOU_SCHEMA = vol.All(
             vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
         }
     ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    _HAS_TARGET,
 )
 
-SERVICE_REQUEST_TOU_SCHEMA = vol.All(
-    vol.Schema(
-        {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
-        }
-    ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
-)
+# request_tou_settings takes only a target
+SERVICE_REQUEST_TOU_SCHEMA = SERVICE_DEVICE_OR_ENTITY_SCHEMA
 
 SERVICE_SET_RECIRCULATION_MODE_SCHEMA = vol.All(
     vol.Schema(
         {
-            vol.Optional(ATTR_DEVICE_ID): cv.string,
-            vol.Optional(ATTR_ENTITY_ID): cv.entity_id,
+            **_TARGET_FIELDS,
             vol.Required(ATTR_RECIRCULATION_MODE): vol.All(
                 vol.Coerce(int), vol.Range(min=1, max=4)
             ),
         }
     ),
-    cv.has_at_least_one_key(ATTR_DEVICE_ID, ATTR_ENTITY_ID),
+    _HAS_TARGET,
 )
 
 
@@ -350,19 +302,55 @@ class NWP500ServiceHandler:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the service handler."""
         self.hass = hass
+        # MAC address -> config entry ID of the coordinator that owns it.
+        # Only entry IDs are held so an unloaded coordinator is never kept
+        # alive by the index; see _lookup_mac. The index lives here rather
+        # than in hass.data, which holds nothing but coordinators.
+        self._mac_index: dict[str, str] = {}
+        # Registries are process-wide singletons; resolved on first use.
+        self._device_registry: dr.DeviceRegistry | None = None
+        self._entity_registry: er.EntityRegistry | None = None
+
+    def _rebuild_mac_index(self) -> None:
+        """Rebuild the MAC index from the loaded coordinators."""
+        self._mac_index = {
+            mac_address: entry_id
+            for entry_id, coordinator in self.hass.data[DOMAIN].items()
+            if coordinator.data
+            for mac_address in coordinator.data
+        }
+
+    def _lookup_mac(
+        self, mac_address: str
+    ) -> NWP500DataUpdateCoordinator | None:
+        """Return the coordinator currently serving `mac_address`, if any.
+
+        An index hit is only trusted while the entry is still loaded and its
+        coordinator still has data for the device, so reloads and unloads
+        never resolve to a stale coordinator.
+        """
+        entry_id = self._mac_index.get(mac_address)
+        if entry_id is None:
+            return None
+        coordinator: NWP500DataUpdateCoordinator | None = self.hass.data[
+            DOMAIN
+        ].get(entry_id)
+        if coordinator and coordinator.data and mac_address in coordinator.data:
+            return coordinator
+        return None
 
     async def _get_coordinator_and_mac(
         self, call: ServiceCall
     ) -> tuple[NWP500DataUpdateCoordinator, str]:
         """Get coordinator and MAC address from service call."""
-        device_registry = dr.async_get(self.hass)
-        entity_registry = er.async_get(self.hass)
-
-        device_id = call.data.get(ATTR_DEVICE_ID)
-        entity_id = call.data.get(ATTR_ENTITY_ID)
+        data = call.data
+        device_id = data.get(ATTR_DEVICE_ID)
+        entity_id = data.get(ATTR_ENTITY_ID)
 
         if entity_id:
-            entity_entry = entity_registry.async_get(entity_id)
+            if self._entity_registry is None:
+                self._entity_registry = er.async_get(self.hass)
+            entity_entry = self._entity_registry.async_get(entity_id)
             if not entity_entry:
                 raise HomeAssistantError(f"Entity {entity_id} not found")
             device_id = entity_entry.device_id
@@ -370,22 +358,27 @@ class NWP500ServiceHandler:
         if not device_id:
             raise HomeAssistantError("Neither device_id nor entity_id provided")
 
-        device_entry = device_registry.async_get(device_id)
+        if self._device_registry is None:
+            self._device_registry = dr.async_get(self.hass)
+        device_entry = self._device_registry.async_get(device_id)
 
         if not device_entry:
             raise HomeAssistantError(f"Device {device_id} not found")
 
-        # Find the coordinator for this device
-        for _entry_id, coordinator in self.hass.data[DOMAIN].items():
-            if not isinstance(coordinator, NWP500DataUpdateCoordinator):
-                continue
-            if not coordinator.data:
-                continue
-            for mac_address in coordinator.data:
-                # Check if device identifiers match
-                for identifier in device_entry.identifiers:
-                    if identifier[0] == DOMAIN and identifier[1] == mac_address:
-                        return coordinator, mac_address
+        mac_addresses = [
+            identifier
+            for domain, identifier in device_entry.identifiers
+            if domain == DOMAIN
+        ]
+
+        # Resolve via the MAC index; on a miss, rebuild it once in case a
+        # coordinator was added or reloaded since it was last built.
+        for attempt in range(2):
+            if attempt:
+                self._rebuild_mac_index()
+            for mac_address in mac_addresses:
+                if coordinator := self._lookup_mac(mac_address):
+                    return coordinator, mac_address
 
         raise HomeAssistantError(
             f"Could not find NWP500 coordinator for device {device_id}"
@@ -393,13 +386,6 @@ class NWP500ServiceHandler:
 
     async def async_set_reservation(self, call: ServiceCall) -> None:
         """Handle set_reservation service call."""
-        try:
-            from nwp500.encoding import build_reservation_entry
-        except ImportError as err:
-            raise HomeAssistantError(
-                "nwp500-python library not available"
-            ) from err
-
         coordinator, mac_address = await self._get_coordinator_and_mac(call)
 
         # SAFETY: Prevent service calls during unit system transitions
@@ -409,12 +395,13 @@ class NWP500ServiceHandler:
                 "Cannot set reservation during unit system change. Please try again."
             )
 
-        enabled = call.data[ATTR_ENABLED]
-        days = call.data[ATTR_DAYS]
-        hour = call.data[ATTR_HOUR]
-        minute = call.data.get(ATTR_MINUTE, 0)
-        mode = call.data[ATTR_OP_MODE]
-        temperature = call.data.get(ATTR_TEMPERATURE)
+        data = call.data
+        enabled = data[ATTR_ENABLED]
+        days = data[ATTR_DAYS]
+        hour = data[ATTR_HOUR]
+        minute = data.get(ATTR_MINUTE, 0)
+        mode = data[ATTR_OP_MODE]
+        temperature = data.get(ATTR_TEMPERATURE)
 
         # Convert mode string to DHW mode ID
         mode_id = MODE_TO_DHW_ID.get(mode)
@@ -424,7 +411,7 @@ class NWP500ServiceHandler:
         # Temperature is guaranteed by schema validation for most modes.
         # For vacation/power_off, we use a default that matches the unit system.
         if temperature is None:
-            if mode in ["vacation", "power_off"]:
+            if mode in _TEMPLESS_MODES:
                 temperature = (
                     DEFAULT_TEMPERATURE_C
                     if coordinator.hass.config.units.temperature_unit
@@ -437,13 +424,10 @@ class NWP500ServiceHandler:
                 )
 
         # Get device features to use device-specific temperature limits
-        features = coordinator.device_features.get(mac_address)
-        device_temp_min = (
-            getattr(features, "dhw_temperature_min", None) if features else None
-        )
-        device_temp_max = (
-            getattr(features, "dhw_temperature_max", None) if features else None
-        )
+        device_temp_min = device_temp_max = None
+        if features := coordinator.device_features.get(mac_address):
+            device_temp_min = getattr(features, "dhw_temperature_min", None)
+            device_temp_max = getattr(features, "dhw_temperature_max", None)
 
         # Use device-specific limits if available, otherwise fallback to constants
         if device_temp_min is not None and device_temp_max is not None:
@@ -491,17 +475,18 @@ class NWP500ServiceHandler:
             else temp_max,
         )
 
-        _LOGGER.info(
-            "Setting reservation for %s: days=%s, time=%02d:%02d, "
-            "mode=%s, temp=%s%s",
-            mac_address,
-            days,
-            hour,
-            minute,
-            mode,
-            temperature,
-            coordinator.hass.config.units.temperature_unit,
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Setting reservation for %s: days=%s, time=%02d:%02d, "
+                "mode=%s, temp=%s%s",
+                mac_address,
+                days,
+                hour,
+                minute,
+                mode,
+                temperature,
+                coordinator.hass.config.units.temperature_unit,
+            )
 
         # Read-modify-write. The write is a full-list replacement at the
         # protocol level, so the read must reflect what the device actually
@@ -605,19 +590,6 @@ class NWP500ServiceHandler:
         if not success:
             raise HomeAssistantError("Failed to request reservations")
 
-    async def async_set_vacation_days(self, call: ServiceCall) -> None:
-        """Handle set_vacation_days service call."""
-        coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        days = call.data[ATTR_DAYS]
-        _LOGGER.info(
-            "Setting vacation mode for %s days on %s", days, mac_address
-        )
-        success = await coordinator.async_send_command(
-            mac_address, "set_vacation_days", days=days
-        )
-        if not success:
-            raise HomeAssistantError("Failed to set vacation days")
-
     async def async_configure_tou_schedule(self, call: ServiceCall) -> None:
         """Handle configure_tou_schedule service call."""
         coordinator, mac_address = await self._get_coordinator_and_mac(call)
@@ -666,58 +638,128 @@ class NWP500ServiceHandler:
         if not success:
             raise HomeAssistantError("Failed to request TOU settings")
 
-    async def async_enable_demand_response(self, call: ServiceCall) -> None:
-        """Handle enable_demand_response service call."""
+    async def async_send_device_command(
+        self,
+        call: ServiceCall,
+        *,
+        command: str,
+        field: str | None,
+        message: str,
+        error: str,
+    ) -> None:
+        """Handle a service call that maps onto a single device command.
+
+        Args:
+            call: The service call.
+            command: Coordinator command to send.
+            field: Service field forwarded as the command's keyword
+                argument of the same name, or None if it takes none.
+            message: INFO log template; takes the field's value, if any,
+                then the MAC address.
+            error: Message raised when the device rejects the command.
+        """
         coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        _LOGGER.info("Enabling demand response for %s", mac_address)
-        success = await coordinator.async_send_command(
-            mac_address, "enable_demand_response"
-        )
-        if not success:
-            raise HomeAssistantError("Failed to enable demand response")
+        kwargs = {field: call.data[field]} if field else {}
+        _LOGGER.info(message, *kwargs.values(), mac_address)
+        if not await coordinator.async_send_command(
+            mac_address, command, **kwargs
+        ):
+            raise HomeAssistantError(error)
 
-    async def async_disable_demand_response(self, call: ServiceCall) -> None:
-        """Handle disable_demand_response service call."""
-        coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        _LOGGER.info("Disabling demand response for %s", mac_address)
-        success = await coordinator.async_send_command(
-            mac_address, "disable_demand_response"
-        )
-        if not success:
-            raise HomeAssistantError("Failed to disable demand response")
 
-    async def async_reset_air_filter(self, call: ServiceCall) -> None:
-        """Handle reset_air_filter service call."""
-        coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        _LOGGER.info("Resetting air filter timer for %s", mac_address)
-        success = await coordinator.async_send_command(
-            mac_address, "reset_air_filter"
-        )
-        if not success:
-            raise HomeAssistantError("Failed to reset air filter timer")
+# (service name, NWP500ServiceHandler method, schema).
+_SERVICES: Final = (
+    (
+        SERVICE_SET_RESERVATION,
+        "async_set_reservation",
+        SERVICE_SET_RESERVATION_SCHEMA,
+    ),
+    (
+        SERVICE_UPDATE_RESERVATIONS,
+        "async_update_reservations",
+        SERVICE_UPDATE_RESERVATIONS_SCHEMA,
+    ),
+    (
+        SERVICE_CLEAR_RESERVATIONS,
+        "async_clear_reservations",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+    (
+        SERVICE_REQUEST_RESERVATIONS,
+        "async_request_reservations",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+    (
+        SERVICE_CONFIGURE_TOU,
+        "async_configure_tou_schedule",
+        SERVICE_CONFIGURE_TOU_SCHEMA,
+    ),
+    (
+        SERVICE_REQUEST_TOU,
+        "async_request_tou_settings",
+        SERVICE_REQUEST_TOU_SCHEMA,
+    ),
+)
 
-    async def async_set_recirculation_mode(self, call: ServiceCall) -> None:
-        """Handle set_recirculation_mode service call."""
-        coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        mode = call.data[ATTR_RECIRCULATION_MODE]
-        _LOGGER.info(
-            "Setting recirculation mode to %d for %s", mode, mac_address
-        )
-        success = await coordinator.async_send_command(
-            mac_address, "set_recirculation_mode", mode=mode
-        )
-        if not success:
-            raise HomeAssistantError("Failed to set recirculation mode")
+# Services that forward to a single coordinator command:
+# (service name, command, forwarded field, log message, error message,
+# schema).
+_COMMAND_SERVICES: Final = (
+    (
+        SERVICE_SET_VACATION_DAYS,
+        "set_vacation_days",
+        ATTR_DAYS,
+        "Setting vacation mode for %s days on %s",
+        "Failed to set vacation days",
+        SERVICE_SET_VACATION_DAYS_SCHEMA,
+    ),
+    (
+        SERVICE_ENABLE_DEMAND_RESPONSE,
+        "enable_demand_response",
+        None,
+        "Enabling demand response for %s",
+        "Failed to enable demand response",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+    (
+        SERVICE_DISABLE_DEMAND_RESPONSE,
+        "disable_demand_response",
+        None,
+        "Disabling demand response for %s",
+        "Failed to disable demand response",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+    (
+        SERVICE_RESET_AIR_FILTER,
+        "reset_air_filter",
+        None,
+        "Resetting air filter timer for %s",
+        "Failed to reset air filter timer",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+    (
+        SERVICE_SET_RECIRCULATION_MODE,
+        "set_recirculation_mode",
+        ATTR_RECIRCULATION_MODE,
+        "Setting recirculation mode to %d for %s",
+        "Failed to set recirculation mode",
+        SERVICE_SET_RECIRCULATION_MODE_SCHEMA,
+    ),
+    (
+        SERVICE_TRIGGER_RECIRCULATION,
+        "trigger_recirculation",
+        None,
+        "Triggering recirculation for %s",
+        "Failed to trigger recirculation",
+        SERVICE_DEVICE_OR_ENTITY_SCHEMA,
+    ),
+)
 
-    async def async_trigger_recirculation(self, call: ServiceCall) -> None:
-        """Handle trigger_recirculation service call."""
-        coordinator, mac_address = await self._get_coordinator_and_mac(call)
-        _LOGGER.info("Triggering recirculation for %s", mac_address)
-        success = await coordinator.async_send_command(
-            mac_address, "trigger_recirculation"
-        )
-        if not success:
-            raise HomeAssistantError("Failed to trigger recirculation")
+# Registration and removal are both driven by the tables above, so the two
+# can never drift apart.
+_SERVICE_NAMES: Final = tuple(
+    service[0] for service in (*_SERVICES, *_COMMAND_SERVICES)
+)
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -827,93 +869,24 @@ async def _async_setup_services(hass: HomeAssistant) -> None:
     if hass.services.has_service(DOMAIN, SERVICE_SET_RESERVATION):
         return
 
-    # Create service handler instance
     handler = NWP500ServiceHandler(hass)
-
-    # Register all services with schemas
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_RESERVATION,
-        handler.async_set_reservation,
-        schema=SERVICE_SET_RESERVATION_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_RESERVATIONS,
-        handler.async_update_reservations,
-        schema=SERVICE_UPDATE_RESERVATIONS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_RESERVATIONS,
-        handler.async_clear_reservations,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REQUEST_RESERVATIONS,
-        handler.async_request_reservations,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_VACATION_DAYS,
-        handler.async_set_vacation_days,
-        schema=SERVICE_SET_VACATION_DAYS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CONFIGURE_TOU,
-        handler.async_configure_tou_schedule,
-        schema=SERVICE_CONFIGURE_TOU_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REQUEST_TOU,
-        handler.async_request_tou_settings,
-        schema=SERVICE_REQUEST_TOU_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ENABLE_DEMAND_RESPONSE,
-        handler.async_enable_demand_response,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DISABLE_DEMAND_RESPONSE,
-        handler.async_disable_demand_response,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_AIR_FILTER,
-        handler.async_reset_air_filter,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_RECIRCULATION_MODE,
-        handler.async_set_recirculation_mode,
-        schema=SERVICE_SET_RECIRCULATION_MODE_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TRIGGER_RECIRCULATION,
-        handler.async_trigger_recirculation,
-        schema=SERVICE_DEVICE_OR_ENTITY_SCHEMA,
-    )
+    for name, method, schema in _SERVICES:
+        hass.services.async_register(
+            DOMAIN, name, getattr(handler, method), schema=schema
+        )
+    for name, command, field, message, error, schema in _COMMAND_SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            name,
+            partial(
+                handler.async_send_device_command,
+                command=command,
+                field=field,
+                message=message,
+                error=error,
+            ),
+            schema=schema,
+        )
 
     _LOGGER.debug("Registered NWP500 services")
 
@@ -928,17 +901,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Unregister services if no more entries
         if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, SERVICE_SET_RESERVATION)
-            hass.services.async_remove(DOMAIN, SERVICE_UPDATE_RESERVATIONS)
-            hass.services.async_remove(DOMAIN, SERVICE_CLEAR_RESERVATIONS)
-            hass.services.async_remove(DOMAIN, SERVICE_REQUEST_RESERVATIONS)
-            hass.services.async_remove(DOMAIN, SERVICE_SET_VACATION_DAYS)
-            hass.services.async_remove(DOMAIN, SERVICE_CONFIGURE_TOU)
-            hass.services.async_remove(DOMAIN, SERVICE_REQUEST_TOU)
-            hass.services.async_remove(DOMAIN, SERVICE_ENABLE_DEMAND_RESPONSE)
-            hass.services.async_remove(DOMAIN, SERVICE_DISABLE_DEMAND_RESPONSE)
-            hass.services.async_remove(DOMAIN, SERVICE_RESET_AIR_FILTER)
-            hass.services.async_remove(DOMAIN, SERVICE_SET_RECIRCULATION_MODE)
-            hass.services.async_remove(DOMAIN, SERVICE_TRIGGER_RECIRCULATION)
+            for name in _SERVICE_NAMES:
+                hass.services.async_remove(DOMAIN, name)
 
     return unload_ok
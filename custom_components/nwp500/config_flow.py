@@ -249,7 +249,8 @@ async def validate_input(
     except Exception as err:  # noqa: BLE001
         # Network, connection, and data access errors
         _LOGGER.error("Failed to authenticate with Navien: %s", err)
-        if "401" in str(err) or "unauthorized" in str(err).lower():
+        message = str(err).lower()
+        if "401" in message or "unauthorized" in message:
             raise InvalidAuth from err
         raise CannotConnect from err
 
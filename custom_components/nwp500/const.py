@@ -1,6 +1,8 @@
 """Constants for the Navien NWP500 integration."""
 
-from typing import TYPE_CHECKING, Any, Final, TypedDict
+import warnings
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, TypedDict
 
 from homeassistant.components.water_heater import (
     STATE_ECO,
@@ -53,6 +55,37 @@ DEFAULT_SCAN_INTERVAL: Final = 30  # seconds
 MIN_SCAN_INTERVAL: Final = 10  # seconds (minimum to avoid server overload)
 MAX_SCAN_INTERVAL: Final = 300  # seconds (maximum 5 minutes)
 
+# Adaptive polling
+# While status responses keep coming back unchanged, the coordinator
+# stretches its interval one step along ADAPTIVE_BACKOFF_FACTORS (multiples
+# of the configured scan interval) every ADAPTIVE_IDLE_POLLS unchanged polls,
+# never beyond MAX_SCAN_INTERVAL. A change in an operating field (mode,
+# setpoint, heating and draw flags, error code) returns it to the configured
+# interval at the next poll; telemetry noise such as RSSI or temperature drift
+# does not. At the default 30s this walks 30, 45, 60, 90, 150, 300 seconds.
+ADAPTIVE_IDLE_POLLS: Final = 3
+ADAPTIVE_BACKOFF_FACTORS: Final = (1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+# Device state overrides the backoff: while any device is heating or drawing
+# hot water the configured interval is held, and while every device is in
+# vacation or powered off the interval is at least this multiple of it.
+ADAPTIVE_STANDBY_FACTOR: Final = 4.0
+
+# Burst polling after a control command
+# A command's effect (a mode change, heating starting) shows up over the next
+# few seconds, so after one succeeds the coordinator polls every
+# BURST_SCAN_INTERVAL seconds for BURST_CYCLES cycles before going back to its
+# normal interval. Burst polls still spend rate limit tokens.
+BURST_SCAN_INTERVAL: Final = 5  # seconds
+BURST_CYCLES: Final = 2
+
+# Per-device status request rate limit (token bucket)
+# MIN_SCAN_INTERVAL only bounds the options form; this is the runtime guard.
+# Refreshes requested after commands can otherwise stack on top of the poll,
+# so each device may burst RATE_LIMIT_BURST requests and then refills at
+# RATE_LIMIT_TOKENS_PER_MIN. A request without a token is skipped, not queued.
+RATE_LIMIT_TOKENS_PER_MIN: Final = 12
+RATE_LIMIT_BURST: Final = 4
+
 # Performance monitoring
 # MQTT request/response typically takes 2-4 seconds due to cloud roundtrip.
 # First-update latency can reach ~8s due to AWS IoT TLS/session establishment.
@@ -60,6 +93,8 @@ MAX_SCAN_INTERVAL: Final = 300  # seconds (maximum 5 minutes)
 SLOW_UPDATE_THRESHOLD: Final = (
     15.0  # seconds - warn if update takes longer than this
 )
+# The same threshold in nanoseconds, for comparing time.monotonic_ns() deltas
+SLOW_UPDATE_THRESHOLD_NS: Final = int(SLOW_UPDATE_THRESHOLD * 1_000_000_000)
 
 # How many coordinator update cycles between re-reads of the programmed
 # reservation/TOU schedules. They change rarely and only on request, so this
@@ -69,7 +104,7 @@ SCHEDULE_REFRESH_CYCLES: Final = 40
 
 # Reconnection backoff parameters
 # Exponential backoff delays (seconds) for MQTT reconnection attempts
-RECONNECT_BACKOFF_DELAYS: Final = [2.0, 5.0, 15.0, 30.0, 60.0]
+RECONNECT_BACKOFF_DELAYS: Final = (2.0, 5.0, 15.0, 30.0, 60.0)
 # Minimum seconds between reconnection attempts (prevents rapid retry loops)
 MIN_RECONNECT_INTERVAL: Final = 30.0
 
@@ -79,6 +114,8 @@ STALE_DATA_THRESHOLD: Final = 5
 
 # Device types and models
 DEVICE_TYPE_WATER_HEATER: Final = 52
+MANUFACTURER: Final = "Navien"
+MODEL: Final = "NWP500"
 
 
 # Utility functions
@@ -93,54 +130,73 @@ def get_enum_value(obj: Any) -> Any:
 
     Returns:
         The .value attribute if the object has one, otherwise the object itself
+
+    Note:
+        A single getattr with a default avoids the second attribute lookup
+        that hasattr followed by .value would make. Callers that already
+        hold an IntEnum can use int(obj) directly.
     """
-    return obj.value if hasattr(obj, "value") else obj
+    return getattr(obj, "value", obj)
 
 
 # CurrentOperationMode mapping for Home Assistant water heater entity
 # Maps nwp500.enums.CurrentOperationMode enum values to HA water heater states
-CURRENT_OPERATION_MODE_TO_HA: Final = {
-    CurrentOperationMode.STANDBY: "standby",
-    CurrentOperationMode.HEAT_PUMP_MODE: STATE_HEAT_PUMP,
-    CurrentOperationMode.HYBRID_EFFICIENCY_MODE: STATE_ECO,
-    CurrentOperationMode.HYBRID_BOOST_MODE: STATE_HIGH_DEMAND,
-}
+CURRENT_OPERATION_MODE_TO_HA: Final = MappingProxyType(
+    {
+        CurrentOperationMode.STANDBY: "standby",
+        CurrentOperationMode.HEAT_PUMP_MODE: STATE_HEAT_PUMP,
+        CurrentOperationMode.HYBRID_EFFICIENCY_MODE: STATE_ECO,
+        CurrentOperationMode.HYBRID_BOOST_MODE: STATE_HIGH_DEMAND,
+    }
+)
 
 # DhwOperationSetting mapping for Home Assistant water heater entity
 # Maps nwp500.enums.DhwOperationSetting enum values to HA water heater states
-DHW_OPERATION_SETTING_TO_HA: Final = {
-    DhwOperationSetting.HEAT_PUMP: STATE_HEAT_PUMP,
-    DhwOperationSetting.ELECTRIC: STATE_ELECTRIC,
-    DhwOperationSetting.ENERGY_SAVER: STATE_ECO,
-    DhwOperationSetting.HIGH_DEMAND: STATE_HIGH_DEMAND,
-    DhwOperationSetting.VACATION: "vacation",
-    DhwOperationSetting.POWER_OFF: "off",
-}
+DHW_OPERATION_SETTING_TO_HA: Final = MappingProxyType(
+    {
+        DhwOperationSetting.HEAT_PUMP: STATE_HEAT_PUMP,
+        DhwOperationSetting.ELECTRIC: STATE_ELECTRIC,
+        DhwOperationSetting.ENERGY_SAVER: STATE_ECO,
+        DhwOperationSetting.HIGH_DEMAND: STATE_HIGH_DEMAND,
+        DhwOperationSetting.VACATION: "vacation",
+        DhwOperationSetting.POWER_OFF: "off",
+    }
+)
+
+# Mapping for all settable DHW operation settings (includes special)
+# Use this when handling vacation mode or displaying current DHW.
+# Derived from DHW_OPERATION_SETTING_TO_HA so the two directions cannot
+# drift; power_off (6) is handled via the on_off feature, not stored here.
+HA_TO_DHW_OPERATION_SETTING: Final = MappingProxyType(
+    {
+        state: int(setting)
+        for setting, state in DHW_OPERATION_SETTING_TO_HA.items()
+        if setting is not DhwOperationSetting.POWER_OFF
+    }
+)
 
 # Reverse mapping for setting DHW operation modes
 # This only includes "normal" operation modes that can be set through
 # the operation_mode feature. Special states (vacation, power_off) are
 # handled separately via away_mode and on_off features
-HA_TO_DHW_MODE: Final = {
-    STATE_ECO: 3,  # "eco" -> Energy Saver mode
-    STATE_HEAT_PUMP: 1,  # "heat_pump" -> Heat Pump Only mode
-    STATE_HIGH_DEMAND: 4,  # "high_demand" -> High Demand mode
-    STATE_ELECTRIC: 2,  # "electric" -> Electric Only mode
-    # Note: vacation (5) and power_off (6) modes are excluded here as
-    # they are handled via dedicated away/on_off features
-}
-
-# Complete mapping for all DHW operation settings (includes special)
-# Use this when handling vacation mode or displaying current DHW
-# Uses dict unpacking (**) - Python 3.5+ feature for clean dict merging
-HA_TO_DHW_OPERATION_SETTING: Final = {
-    **HA_TO_DHW_MODE,  # Include all normal operation modes
-    "vacation": 5,  # VACATION mode (handled via away_mode feature)
-    # Note: power_off (6) handled via on_off feature, not stored here
-}
-
-# Alias for consistency
-DHW_MODE_TO_HA: Final = DHW_OPERATION_SETTING_TO_HA
+HA_TO_DHW_MODE: Final = MappingProxyType(
+    {
+        state: mode_id
+        for state, mode_id in HA_TO_DHW_OPERATION_SETTING.items()
+        if state != "vacation"
+    }
+)
+
+
+# CurrentOperationMode values are multiples of 32 (0, 32, 64, 96), so
+# value >> 5 indexes this tuple directly on every status update.
+_CURRENT_OPERATION_MODE_STATES: Final = tuple(
+    {
+        get_enum_value(mode): state
+        for mode, state in CURRENT_OPERATION_MODE_TO_HA.items()
+    }.get(index << 5)
+    for index in range(4)
+)
 
 
 def get_current_operation_mode_state(
@@ -148,12 +204,25 @@ def get_current_operation_mode_state(
 ) -> str:
     """Map a CurrentOperationMode value to a Home Assistant state string."""
     raw_value = get_enum_value(value)
-    fallback = f"mode_{raw_value}" if default is None else default
-
-    try:
-        return CURRENT_OPERATION_MODE_TO_HA[CurrentOperationMode(raw_value)]
-    except TypeError, ValueError, KeyError:
-        return fallback
+    if (
+        isinstance(raw_value, int)
+        and not raw_value & 31
+        and 0 <= raw_value >> 5 < len(_CURRENT_OPERATION_MODE_STATES)
+        and (state := _CURRENT_OPERATION_MODE_STATES[raw_value >> 5])
+    ):
+        return state
+    return f"mode_{raw_value}" if default is None else default
+
+
+# DhwOperationSetting values are the contiguous integers 1-6, so the value
+# indexes this tuple directly; slot 0 is unused.
+_DHW_OPERATION_SETTING_STATES: Final = tuple(
+    {
+        get_enum_value(setting): state
+        for setting, state in DHW_OPERATION_SETTING_TO_HA.items()
+    }.get(index)
+    for index in range(7)
+)
 
 
 def get_dhw_operation_setting_state(
@@ -161,24 +230,45 @@ def get_dhw_operation_setting_state(
 ) -> str:
     """Map a DhwOperationSetting value to a Home Assistant state string."""
     raw_value = get_enum_value(value)
-    fallback = f"mode_{raw_value}" if default is None else default
-
-    try:
-        return DHW_OPERATION_SETTING_TO_HA[DhwOperationSetting(raw_value)]
-    except TypeError, ValueError, KeyError:
-        return fallback
+    if (
+        isinstance(raw_value, int)
+        and 0 <= raw_value < len(_DHW_OPERATION_SETTING_STATES)
+        and (state := _DHW_OPERATION_SETTING_STATES[raw_value])
+    ):
+        return state
+    return f"mode_{raw_value}" if default is None else default
 
 
 # Mapping for reservation service calls (friendly mode names to DHW mode IDs)
 # Used by set_reservation and related services
-MODE_TO_DHW_ID: Final = {
-    "heat_pump": 1,
-    "electric": 2,
-    "energy_saver": 3,
-    "high_demand": 4,
-    "vacation": 5,
-    "power_off": 6,
-}
+MODE_TO_DHW_ID: Final = MappingProxyType(
+    {
+        "heat_pump": 1,
+        "electric": 2,
+        "energy_saver": 3,
+        "high_demand": 4,
+        "vacation": 5,
+        "power_off": 6,
+    }
+)
+
+# Valid operation modes for reservations: exactly the modes that have a
+# DHW mode ID, so the validator and the lookup cannot disagree.
+VALID_MODES: Final = frozenset(MODE_TO_DHW_ID)
+
+# Valid days of the week for reservations. A frozenset: only ever used for
+# membership tests by vol.In, which is a hash lookup on a set.
+VALID_DAYS: Final = frozenset(
+    {
+        "Sunday",
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+    }
+)
 
 # Temperature ranges (from nwp500-python documentation)
 MIN_TEMPERATURE_F: Final = 80  # °F (minimum safe operating temperature)
@@ -186,936 +276,604 @@ MAX_TEMPERATURE_F: Final = 150  # °F (maximum supported by device)
 MIN_TEMPERATURE_C: Final = 27  # °C (~80.6°F)
 MAX_TEMPERATURE_C: Final = 65  # °C (~149°F)
 
-# All device status fields that can be mapped to entities
-# Most will be disabled by default but available for users to enable
-DEVICE_STATUS_SENSORS: Final = {
-    "outside_temperature": {
-        "name": "Outside Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "tank_upper_temperature": {
-        "name": "Tank Upper Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "tank_lower_temperature": {
-        "name": "Tank Lower Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "discharge_temperature": {
-        "name": "Compressor Discharge Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "suction_temperature": {
-        "name": "Compressor Suction Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "evaporator_temperature": {
-        "name": "Evaporator Coil Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "ambient_temperature": {
-        "name": "Ambient Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "dhw_temperature": {
-        "name": "DHW Outlet Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "dhw_temperature_2": {
-        "name": "DHW Secondary Sensor Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "current_inlet_temperature": {
-        "name": "Cold Water Inlet Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "current_inst_power": {
-        "name": "Current Power",
-        "device_class": "power",
-        "unit": "W",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "dhw_charge_per": {
-        "name": "DHW Charge Percentage",
-        "device_class": None,
-        "unit": "%",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": True,
-    },
-    "wifi_rssi": {
-        "name": "WiFi RSSI",
-        "device_class": "signal_strength",
-        "unit": "dBm",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "error_code": {
-        "name": "Error Code",
-        "device_class": None,
-        "unit": None,
-        "state_class": None,
-        "entity_registry_enabled_default": True,
-    },
-    "sub_error_code": {
-        "name": "Sub Error Code",
-        "device_class": None,
-        "unit": None,
-        "state_class": None,
-        "entity_registry_enabled_default": False,
-    },
-    "current_dhw_flow_rate": {
-        "name": "Current DHW Flow Rate",
-        "device_class": None,
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "target_super_heat": {
-        "name": "Target Superheat",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "current_super_heat": {
-        "name": "Current Superheat",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "target_fan_rpm": {
-        "name": "Target Fan RPM",
-        "device_class": None,
-        "unit": "RPM",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "current_fan_rpm": {
-        "name": "Current Fan RPM",
-        "device_class": None,
-        "unit": "RPM",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "fan_pwm": {
-        "name": "Fan PWM",
-        "device_class": None,
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "mixing_rate": {
-        "name": "Mixing Rate",
-        "device_class": None,
-        "unit": "%",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "eev_step": {
-        "name": "EEV Step",
-        "device_class": None,
-        "unit": None,
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "vacation_day_setting": {
-        "name": "Vacation Day Setting",
-        "device_class": None,
-        "unit": "days",
-        "state_class": None,
-        "entity_registry_enabled_default": False,
-    },
-    "vacation_day_elapsed": {
-        "name": "Vacation Day Elapsed",
-        "device_class": None,
-        "unit": "days",
-        "state_class": "measurement",
-        "entity_registry_enabled_default": False,
-    },
-    "cumulated_dhw_flow_rate": {
-        "name": "Cumulated DHW Flow Rate",
-        "device_class": None,
-        "unit": None,
-        "state_class": "total_increasing",
-        "entity_registry_enabled_default": False,
-    },
-    "usable_energy": {
-        "name": "Usable Energy",
-        "device_class": "energy_storage",
-        "unit": "Wh",
-        "entity_registry_enabled_default": True,
-    },
-    "energy_to_setpoint": {
-        "name": "Energy to Setpoint",
-        "device_class": None,
-        "unit": "Wh",
-        "entity_registry_enabled_default": False,
-    },
-    "full_recovery_energy": {
-        "name": "Full Recovery Energy",
-        "device_class": None,
-        "unit": "Wh",
-        "entity_registry_enabled_default": False,
-    },
-}
-
-# Binary sensor fields for on/off states
-DEVICE_STATUS_BINARY_SENSORS: Final = {
-    "operation_busy": {
-        "name": "Operation Busy",
-        "device_class": "running",
-        "entity_registry_enabled_default": True,
-    },
-    "freeze_protection_use": {
-        "name": "Freeze Protection Active",
-        "entity_registry_enabled_default": False,
-    },
-    "dhw_use": {
-        "name": "DHW In Use",
-        "device_class": "running",
-        "entity_registry_enabled_default": True,
-    },
-    "dhw_use_sustained": {
-        "name": "DHW Use Sustained",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "comp_use": {
-        "name": "Compressor Running",
-        "device_class": "running",
-        "entity_registry_enabled_default": True,
-    },
-    "eev_use": {
-        "name": "EEV Active",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "eva_fan_use": {
-        "name": "Evaporator Fan Running",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "heat_upper_use": {
-        "name": "Upper Electric Heating Element",
-        "device_class": "heat",
-        "entity_registry_enabled_default": True,
-    },
-    "heat_lower_use": {
-        "name": "Lower Electric Heating Element",
-        "device_class": "heat",
-        "entity_registry_enabled_default": True,
-    },
-    "scald_use": {
-        "name": "Scald Protection Warning",
-        "device_class": "safety",
-        "entity_registry_enabled_default": False,
-    },
-    "anti_legionella_use": {
-        "name": "Anti-Legionella Enabled",
-        "entity_registry_enabled_default": False,
-    },
-    "anti_legionella_operation_busy": {
-        "name": "Anti-Legionella Cycle Running",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "air_filter_alarm_use": {
-        "name": "Air Filter Alarm Enabled",
-        "entity_registry_enabled_default": False,
-    },
-    "error_buzzer_use": {
-        "name": "Error Buzzer Enabled",
-        "entity_registry_enabled_default": False,
-    },
-    "eco_use": {
-        "name": "Overheat Protection Enabled",
-        "entity_registry_enabled_default": False,
-    },
-    "program_reservation_use": {
-        "name": "Program Reservation Active",
-        "device_class": None,
-        "entity_registry_enabled_default": False,
-    },
-    # Recirculation sensors
-    "recirculation_use": {
-        "name": "Recirculation Active",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "recirculation_pump_operation_status": {
-        "name": "Recirculation Pump Running",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "recirculation_operation_busy": {
-        "name": "Recirculation Operation Busy",
-        "device_class": "running",
-        "entity_registry_enabled_default": False,
-    },
-    "recirculation_hot_button_ready": {
-        "name": "Recirculation Hot Button Ready",
-        "device_class": None,
-        "entity_registry_enabled_default": False,
-    },
-    "recirculation_reservation_use": {
-        "name": "Recirculation Reservation Active",
-        "device_class": None,
-        "entity_registry_enabled_default": False,
-    },
-    # Sensor status
-    "con_ovr_sensor_use": {
-        "name": "Condensate Overflow Sensor Active",
-        "entity_registry_enabled_default": False,
-    },
-    "wtr_ovr_sensor_use": {
-        "name": "Water Leak Detected",
-        "device_class": "safety",
-        "entity_registry_enabled_default": False,
-    },
-    "shut_off_valve_use": {
-        "name": "Shut-Off Valve Status",
-        "entity_registry_enabled_default": False,
-    },
-}
+
+class BinarySensorConfig(NamedTuple):
+    """Static description of a device status binary sensor."""
+
+    key: str
+    name: str
+    device_class: str | None  # BinarySensorDeviceClass value
+    enabled: bool
+    attr: str | None  # DeviceStatus attribute; defaults to the key
+
+
+# Binary sensor fields for on/off states, one row per entity.
+DEVICE_STATUS_BINARY_SENSORS: Final = (
+    BinarySensorConfig(
+        "operation_busy", "Operation Busy", "running", True, None
+    ),
+    BinarySensorConfig(
+        "freeze_protection_use", "Freeze Protection Active", None, True, None
+    ),
+    BinarySensorConfig("dhw_use", "DHW In Use", "running", True, None),
+    BinarySensorConfig(
+        "dhw_use_sustained", "DHW Use Sustained", "running", False, None
+    ),
+    BinarySensorConfig("comp_use", "Compressor Running", "running", True, None),
+    BinarySensorConfig("eev_use", "EEV Active", "running", False, None),
+    BinarySensorConfig(
+        "eva_fan_use", "Evaporator Fan Running", "running", False, None
+    ),
+    BinarySensorConfig(
+        "heat_upper_use", "Upper Electric Heating Element", "heat", True, None
+    ),
+    BinarySensorConfig(
+        "heat_lower_use", "Lower Electric Heating Element", "heat", True, None
+    ),
+    BinarySensorConfig(
+        "scald_use", "Scald Protection Warning", "safety", False, None
+    ),
+    BinarySensorConfig(
+        "anti_legionella_use", "Anti-Legionella Enabled", None, False, None
+    ),
+    BinarySensorConfig(
+        "anti_legionella_operation_busy",
+        "Anti-Legionella Cycle Running",
+        "running",
+        False,
+        None,
+    ),
+    BinarySensorConfig(
+        "air_filter_alarm_use", "Air Filter Alarm Enabled", None, False, None
+    ),
+    BinarySensorConfig(
+        "error_buzzer_use", "Error Buzzer Enabled", None, False, None
+    ),
+    BinarySensorConfig(
+        "eco_use", "Overheat Protection Enabled", None, False, None
+    ),
+    BinarySensorConfig(
+        "program_reservation_use",
+        "Program Reservation Active",
+        None,
+        False,
+        None,
+    ),
+    BinarySensorConfig(
+        "shut_off_valve_use", "Shut-Off Valve Status", None, False, None
+    ),
+    BinarySensorConfig(
+        "con_ovr_sensor_use",
+        "Condensate Overflow Sensor Active",
+        None,
+        False,
+        None,
+    ),
+    BinarySensorConfig(
+        "wtr_ovr_sensor_use", "Water Leak Detected", "safety", False, None
+    ),
+    BinarySensorConfig(
+        "did_reload", "Device Recently Reloaded", None, False, None
+    ),
+    BinarySensorConfig(
+        "recirculation_pump_operation_status",
+        "Recirculation Pump Running",
+        "running",
+        False,
+        "recirc_pump_operation_status",
+    ),
+    BinarySensorConfig(
+        "recirculation_operation_busy",
+        "Recirculation Operation Busy",
+        "running",
+        False,
+        "recirc_operation_busy",
+    ),
+    BinarySensorConfig(
+        "recirculation_hot_button_ready",
+        "Recirculation Hot Button Ready",
+        None,
+        False,
+        "recirc_hot_btn_ready",
+    ),
+    BinarySensorConfig(
+        "recirculation_reservation_use",
+        "Recirculation Reservation Active",
+        None,
+        False,
+        "recirc_reservation_use",
+    ),
+    BinarySensorConfig(
+        "tou_override_status", "TOU Override Status", None, True, None
+    ),
+    BinarySensorConfig("tou_status", "TOU Status", None, True, None),
+)
+
+
+class SensorConfig(NamedTuple):
+    """Static description of a device status sensor.
+
+    String fields hold the keys that sensor.py maps onto Home Assistant
+    units, device classes, state classes and entity categories.
+    """
+
+    name: str
+    attr: str = ""  # Status attribute; defaults to the SENSOR_CONFIGS key
+    device_class: str | None = None
+    unit: str | None = None
+    state_class: str | None = None
+    enabled: bool = False
+    special: str | None = None
+    precision: int | None = None
+    entity_category: str | None = None
+
+
+def _temperature(
+    name: str, attr: str = "", *, enabled: bool = False
+) -> SensorConfig:
+    """Describe an absolute temperature sensor reported in the device unit."""
+    return SensorConfig(
+        name=name,
+        attr=attr,
+        device_class="temperature",
+        state_class="measurement",
+        enabled=enabled,
+    )
+
 
 # Data-driven sensor configuration
 # This replaces ~400 lines of repetitive sensor description code
-SENSOR_CONFIGS: Final = {
-    # Temperature sensors
-    "outside_temperature": {
-        "attr": "outside_temperature",
-        "name": "Outside Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    "tank_upper_temperature": {
-        "attr": "tank_upper_temperature",
-        "name": "Tank Upper Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    "tank_lower_temperature": {
-        "attr": "tank_lower_temperature",
-        "name": "Tank Lower Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    "discharge_temperature": {
-        "attr": "discharge_temperature",
-        "name": "Compressor Discharge Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "suction_temperature": {
-        "attr": "suction_temperature",
-        "name": "Compressor Suction Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "evaporator_temperature": {
-        "attr": "evaporator_temperature",
-        "name": "Evaporator Coil Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "ambient_temperature": {
-        "attr": "ambient_temperature",
-        "name": "Ambient Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "dhw_temperature": {
-        "attr": "dhw_temperature",
-        "name": "DHW Outlet Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    "dhw_temperature_2": {
-        "attr": "dhw_temperature2",
-        "name": "DHW Secondary Sensor Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "current_inlet_temperature": {
-        "attr": "current_inlet_temperature",
-        "name": "Cold Water Inlet Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "freeze_protection_temperature": {
-        "attr": "freeze_protection_temperature",
-        "name": "Freeze Protection Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "target_super_heat": {
-        "attr": "target_super_heat",
-        "name": "Target Superheat",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "current_super_heat": {
-        "attr": "current_super_heat",
-        "name": "Current Superheat",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Power and energy sensors
-    "current_inst_power": {
-        "attr": "current_inst_power",
-        "name": "Current Power",
-        "device_class": "power",
-        "unit": "W",
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    # Energy drawable from the tank as useful hot water. This is the only one
-    # of the three that behaves like a state of charge: the other two are both
-    # measured from the setpoint, so they move when the setpoint moves even
-    # though the water in the tank does not.
-    "usable_energy": {
-        "attr": "usable_energy",
-        "name": "Usable Energy",
-        "device_class": "energy_storage",
-        "unit": "Wh",
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    # Energy needed to bring the tank from its current temperature up to the
-    # setpoint. No device_class: a deficit is not stored energy.
-    "energy_to_setpoint": {
-        "attr": "energy_to_setpoint",
-        "name": "Energy to Setpoint",
-        "unit": "Wh",
-        "state_class": "measurement",
-        "precision": 0,
-        "enabled": False,
-    },
-    # Energy to recover a fully depleted tank to the current setpoint.
-    "full_recovery_energy": {
-        "attr": "full_recovery_energy",
-        "name": "Full Recovery Energy",
-        "unit": "Wh",
-        "state_class": "measurement",
-        "precision": 0,
-        "enabled": False,
-    },
-    # Percentage sensors
-    "dhw_charge_per": {
-        "attr": "dhw_charge_per",
-        "name": "DHW Charge",
-        "unit": "%",
-        "state_class": "measurement",
-        "enabled": True,
-    },
-    "mixing_rate": {
-        "attr": "mixing_rate",
-        "name": "Mixing Rate",
-        "unit": "%",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "fan_pwm": {
-        "attr": "fan_pwm",
-        "name": "Fan PWM",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Signal strength
-    "wifi_rssi": {
-        "attr": "wifi_rssi",
-        "name": "WiFi RSSI",
-        "device_class": "signal_strength",
-        "unit": "dBm",
-        "state_class": "measurement",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    # Status and error codes
-    "error_code": {
-        "attr": "error_code",
-        "name": "Error Code",
-        "special": "enum_name",
-        "enabled": True,
-        "entity_category": "diagnostic",
-    },
-    "sub_error_code": {
-        "attr": "sub_error_code",
-        "name": "Sub Error Code",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    # Flow rate sensors
-    "current_dhw_flow_rate": {
-        "attr": "current_dhw_flow_rate",
-        "name": "Current DHW Flow Rate",
-        "unit": "GPM",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "cumulated_dhw_flow_rate": {
-        "attr": "cumulated_dhw_flow_rate",
-        "name": "Cumulated DHW Flow Rate",
-        "device_class": "water",
-        "unit": "gal",
-        "state_class": "total_increasing",
-        "enabled": False,
-    },
-    # Fan sensors
-    "target_fan_rpm": {
-        "attr": "target_fan_rpm",
-        "name": "Target Fan RPM",
-        "unit": "RPM",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "current_fan_rpm": {
-        "attr": "current_fan_rpm",
-        "name": "Current Fan RPM",
-        "unit": "RPM",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Vacation sensors
-    "vacation_day_setting": {
-        "attr": "vacation_day_setting",
-        "name": "Vacation Day Setting",
-        "unit": "d",
-        "device_class": "duration",
-        "enabled": False,
-    },
-    "vacation_day_elapsed": {
-        "attr": "vacation_day_elapsed",
-        "name": "Vacation Day Elapsed",
-        "unit": "d",
-        "device_class": "duration",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Heat source sensor
-    "current_heat_use": {
-        "attr": "current_heat_use",
-        "name": "Current Heat Source",
-        "special": "enum_name",
-        "enabled": True,
-    },
-    # Diagnostic sensors
-    "eev_step": {
-        "attr": "eev_step",
-        "name": "EEV Step",
-        "state_class": "measurement",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    "current_state_num": {
-        "attr": "current_statenum",
-        "name": "Current State Number",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    "smart_diagnostic": {
-        "attr": "smart_diagnostic",
-        "name": "Smart Diagnostic",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    "special_function_status": {
-        "attr": "special_function_status",
-        "name": "Special Function Status",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    "fault_status_1": {
-        "attr": "fault_status1",
-        "name": "Fault Status 1",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    "fault_status_2": {
-        "attr": "fault_status2",
-        "name": "Fault Status 2",
-        "enabled": False,
-        "entity_category": "diagnostic",
-    },
-    # Operation mode sensors (these have custom value_fn handling)
-    "operation_mode": {
-        "attr": "operation_mode",
-        "name": "Current Operation Mode",
-        "enabled": True,
-        "special": "enum_name",  # Custom handling for enum.name
-    },
-    "dhw_operation_setting": {
-        "attr": "dhw_operation_setting",
-        "name": "DHW Operation Setting",
-        "enabled": True,
-        "special": "enum_name",  # Custom handling for enum.name
-    },
-    # DHW temperature settings
-    "dhw_target_temperature_setting": {
-        "attr": "dhw_target_temperature_setting",
-        "name": "DHW Target Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "dhw_temperature_setting": {
-        "attr": "dhw_temperature_setting",
-        "name": "DHW Target Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Heat pump temperature settings
-    "hp_upper_on_temp_setting": {
-        "attr": "hp_upper_on_temp_setting",
-        "name": "HP Upper On Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_lower_on_temp_setting": {
-        "attr": "hp_lower_on_temp_setting",
-        "name": "HP Lower On Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_upper_off_temp_setting": {
-        "attr": "hp_upper_off_temp_setting",
-        "name": "HP Upper Off Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_lower_off_temp_setting": {
-        "attr": "hp_lower_off_temp_setting",
-        "name": "HP Lower Off Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Differential temperature settings (relative values, not absolute)
-    # Note: device_class is intentionally omitted from differential temp sensors.
-    # Home Assistant applies absolute temperature conversions (including offset) to
-    # entities with device_class: temperature, which is incorrect for relative values.
-    # Differential sensors represent the difference between two temperatures, not
-    # absolute values, so the conversion would produce invalid results.
-    "hp_upper_on_diff_temp_setting": {
-        "attr": "hp_upper_on_diff_temp_setting",
-        "name": "HP Upper On Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_lower_on_diff_temp_setting": {
-        "attr": "hp_lower_on_diff_temp_setting",
-        "name": "HP Lower On Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_upper_off_diff_temp_setting": {
-        "attr": "hp_upper_off_diff_temp_setting",
-        "name": "HP Upper Off Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "hp_lower_off_diff_temp_setting": {
-        "attr": "hp_lower_off_diff_temp_setting",
-        "name": "HP Lower Off Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Electric heating temperature settings
-    "he_upper_on_temp_setting": {
-        "attr": "he_upper_on_temp_setting",
-        "name": "HE Upper On Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_lower_on_temp_setting": {
-        "attr": "he_lower_on_temp_setting",
-        "name": "HE Lower On Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_upper_off_temp_setting": {
-        "attr": "he_upper_off_temp_setting",
-        "name": "HE Upper Off Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_lower_off_temp_setting": {
-        "attr": "he_lower_off_temp_setting",
-        "name": "HE Lower Off Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_upper_on_diff_temp_setting": {
-        "attr": "he_upper_on_diff_temp_setting",
-        "name": "HE Upper On Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_lower_on_diff_temp_setting": {
-        "attr": "he_lower_on_diff_temp_setting",
-        "name": "HE Lower On Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_upper_off_diff_temp_setting": {
-        "attr": "he_upper_off_diff_temp_setting",
-        "name": "HE Upper Off Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "he_lower_off_diff_temp_setting": {
-        "attr": "he_lower_off_diff_temp_setting",
-        "name": "HE Lower Off Diff Temperature Setting",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Other temperature settings
-    "heat_min_op_temperature": {
-        "attr": "heat_min_op_temperature",
-        "name": "Heat Min Operating Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "freeze_protection_temp_min": {
-        "attr": "freeze_protection_temp_min",
-        "name": "Freeze Protection Min Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "freeze_protection_temp_max": {
-        "attr": "freeze_protection_temp_max",
-        "name": "Freeze Protection Max Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "recirculation_temp_setting": {
-        "attr": "recirc_temp_setting",
-        "name": "Recirculation Temperature Setting",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "recirculation_temperature": {
-        "attr": "recirc_temperature",
-        "name": "Recirculation Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "recirculation_faucet_temperature": {
-        "attr": "recirc_faucet_temperature",
-        "name": "Recirculation Faucet Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Flow rate sensors
-    "recirculation_dhw_flow_rate": {
-        "attr": "recirc_dhw_flow_rate",
-        "name": "Recirculation DHW Flow Rate",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Operation time sensors
-    "cumulated_evaporator_fan_op_time": {
-        "attr": "cumulated_op_time_eva_fan",
-        "name": "Cumulated Evaporator Fan Operation Time",
-        "unit": "h",
-        "device_class": "duration",
-        "state_class": "total_increasing",
-        "enabled": False,
-    },
-    # Anti-legionella and alarm settings
-    "anti_legionella_period": {
-        "attr": "anti_legionella_period",
-        "name": "Anti-Legionella Period",
-        "unit": "d",
-        "device_class": "duration",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "air_filter_alarm_period": {
-        "attr": "air_filter_alarm_period",
-        "name": "Air Filter Alarm Period",
-        "unit": "h",
-        "device_class": "duration",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "air_filter_alarm_elapsed": {
-        "attr": "air_filter_alarm_elapsed",
-        "name": "Air Filter Alarm Elapsed",
-        "unit": "h",
-        "device_class": "duration",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    # Diagnostic and status sensors
-    "temperature_type": {
-        "attr": "temperature_type",
-        "name": "Temperature Type",
-        "special": "enum_name",
-        "enabled": False,
-    },
-    "temp_formula_type": {
-        "attr": "temp_formula_type",
-        "name": "Temperature Formula Type",
-        "special": "enum_name",
-        "enabled": False,
-    },
-    "dr_event_status": {
-        "attr": "dr_event_status",
-        "name": "DR Event Status",
-        "special": "enum_name",
-        "enabled": False,
-    },
-    "dr_override_status": {
-        "attr": "dr_override_status",
-        "name": "DR Override Hours Remaining",
-        "unit": "h",
-        "device_class": "duration",
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "recirculation_error_status": {
-        "attr": "recirc_error_status",
-        "name": "Recirculation Error Status",
-        "enabled": False,
-    },
-    "recirculation_operation_reason": {
-        "attr": "recirc_operation_reason",
-        "name": "Recirculation Operation Reason",
-        "enabled": False,
-    },
-    "recirculation_operation_mode": {
-        "attr": "recirc_operation_mode",
-        "name": "Recirculation Operation Mode",
-        "special": "enum_name",
-        "enabled": False,
-    },
-    "recirculation_model_type_code": {
-        "attr": "recirc_model_type_code",
-        "name": "Recirculation Model Type Code",
-        "enabled": False,
-    },
-    "recirculation_sw_version": {
-        "attr": "recirc_sw_version",
-        "name": "Recirculation Software Version",
-        "enabled": False,
-    },
-    "recirculation_temperature_min": {
-        "attr": "recirc_temperature_min",
-        "name": "Recirculation Minimum Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "recirculation_temperature_max": {
-        "attr": "recirc_temperature_max",
-        "name": "Recirculation Maximum Temperature",
-        "device_class": "temperature",
-        "unit": None,
-        "state_class": "measurement",
-        "enabled": False,
-    },
-    "program_reservation_type": {
-        "attr": "program_reservation_type",
-        "name": "Program Reservation Type",
-        "enabled": False,
-    },
-}
+SENSOR_CONFIGS: Final = MappingProxyType(
+    {
+        # Temperature sensors
+        "outside_temperature": _temperature(
+            "Outside Temperature", enabled=True
+        ),
+        "tank_upper_temperature": _temperature(
+            "Tank Upper Temperature", enabled=True
+        ),
+        "tank_lower_temperature": _temperature(
+            "Tank Lower Temperature", enabled=True
+        ),
+        "discharge_temperature": _temperature(
+            "Compressor Discharge Temperature"
+        ),
+        "suction_temperature": _temperature("Compressor Suction Temperature"),
+        "evaporator_temperature": _temperature("Evaporator Coil Temperature"),
+        "ambient_temperature": _temperature("Ambient Temperature"),
+        "dhw_temperature": _temperature("DHW Outlet Temperature", enabled=True),
+        "dhw_temperature_2": _temperature(
+            "DHW Secondary Sensor Temperature", "dhw_temperature2"
+        ),
+        "current_inlet_temperature": _temperature(
+            "Cold Water Inlet Temperature"
+        ),
+        "freeze_protection_temperature": _temperature(
+            "Freeze Protection Temperature"
+        ),
+        "target_super_heat": _temperature("Target Superheat"),
+        "current_super_heat": _temperature("Current Superheat"),
+        # Power and energy sensors
+        "current_inst_power": SensorConfig(
+            name="Current Power",
+            device_class="power",
+            unit="W",
+            state_class="measurement",
+            enabled=True,
+        ),
+        # Energy drawable from the tank as useful hot water. This is the only one
+        # of the three that behaves like a state of charge: the other two are both
+        # measured from the setpoint, so they move when the setpoint moves even
+        # though the water in the tank does not.
+        "usable_energy": SensorConfig(
+            name="Usable Energy",
+            device_class="energy_storage",
+            unit="Wh",
+            state_class="measurement",
+            enabled=True,
+        ),
+        # Energy needed to bring the tank from its current temperature up to the
+        # setpoint. No device_class: a deficit is not stored energy.
+        "energy_to_setpoint": SensorConfig(
+            name="Energy to Setpoint",
+            unit="Wh",
+            state_class="measurement",
+            precision=0,
+            enabled=False,
+        ),
+        # Energy to recover a fully depleted tank to the current setpoint.
+        "full_recovery_energy": SensorConfig(
+            name="Full Recovery Energy",
+            unit="Wh",
+            state_class="measurement",
+            precision=0,
+            enabled=False,
+        ),
+        # Percentage sensors
+        "dhw_charge_per": SensorConfig(
+            name="DHW Charge",
+            unit="%",
+            state_class="measurement",
+            enabled=True,
+        ),
+        "mixing_rate": SensorConfig(
+            name="Mixing Rate",
+            unit="%",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "fan_pwm": SensorConfig(
+            name="Fan PWM",
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Signal strength
+        "wifi_rssi": SensorConfig(
+            name="WiFi RSSI",
+            device_class="signal_strength",
+            unit="dBm",
+            state_class="measurement",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        # Status and error codes
+        "error_code": SensorConfig(
+            name="Error Code",
+            special="enum_name",
+            enabled=True,
+            entity_category="diagnostic",
+        ),
+        "sub_error_code": SensorConfig(
+            name="Sub Error Code",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        # Flow rate sensors
+        "current_dhw_flow_rate": SensorConfig(
+            name="Current DHW Flow Rate",
+            unit="GPM",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "cumulated_dhw_flow_rate": SensorConfig(
+            name="Cumulated DHW Flow Rate",
+            device_class="water",
+            unit="gal",
+            state_class="total_increasing",
+            enabled=False,
+        ),
+        # Fan sensors
+        "target_fan_rpm": SensorConfig(
+            name="Target Fan RPM",
+            unit="RPM",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "current_fan_rpm": SensorConfig(
+            name="Current Fan RPM",
+            unit="RPM",
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Vacation sensors
+        "vacation_day_setting": SensorConfig(
+            name="Vacation Day Setting",
+            unit="d",
+            device_class="duration",
+            enabled=False,
+        ),
+        "vacation_day_elapsed": SensorConfig(
+            name="Vacation Day Elapsed",
+            unit="d",
+            device_class="duration",
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Heat source sensor
+        "current_heat_use": SensorConfig(
+            name="Current Heat Source",
+            special="enum_name",
+            enabled=True,
+        ),
+        # Diagnostic sensors
+        "eev_step": SensorConfig(
+            name="EEV Step",
+            state_class="measurement",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        "current_state_num": SensorConfig(
+            attr="current_statenum",
+            name="Current State Number",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        "smart_diagnostic": SensorConfig(
+            name="Smart Diagnostic",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        "special_function_status": SensorConfig(
+            name="Special Function Status",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        "fault_status_1": SensorConfig(
+            attr="fault_status1",
+            name="Fault Status 1",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        "fault_status_2": SensorConfig(
+            attr="fault_status2",
+            name="Fault Status 2",
+            enabled=False,
+            entity_category="diagnostic",
+        ),
+        # Operation mode sensors (these have custom value_fn handling)
+        "operation_mode": SensorConfig(
+            name="Current Operation Mode",
+            enabled=True,
+            special="enum_name",  # Custom handling for enum.name
+        ),
+        "dhw_operation_setting": SensorConfig(
+            name="DHW Operation Setting",
+            enabled=True,
+            special="enum_name",  # Custom handling for enum.name
+        ),
+        # DHW temperature settings
+        "dhw_target_temperature_setting": _temperature(
+            "DHW Target Temperature Setting"
+        ),
+        "dhw_temperature_setting": _temperature("DHW Target Temperature"),
+        # Heat pump temperature settings
+        "hp_upper_on_temp_setting": _temperature(
+            "HP Upper On Temperature Setting"
+        ),
+        "hp_lower_on_temp_setting": _temperature(
+            "HP Lower On Temperature Setting"
+        ),
+        "hp_upper_off_temp_setting": _temperature(
+            "HP Upper Off Temperature Setting"
+        ),
+        "hp_lower_off_temp_setting": _temperature(
+            "HP Lower Off Temperature Setting"
+        ),
+        # Differential temperature settings (relative values, not absolute)
+        # Note: device_class is intentionally omitted from differential temp sensors.
+        # Home Assistant applies absolute temperature conversions (including offset) to
+        # entities with device_class: temperature, which is incorrect for relative values.
+        # Differential sensors represent the difference between two temperatures, not
+        # absolute values, so the conversion would produce invalid results.
+        "hp_upper_on_diff_temp_setting": SensorConfig(
+            name="HP Upper On Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "hp_lower_on_diff_temp_setting": SensorConfig(
+            name="HP Lower On Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "hp_upper_off_diff_temp_setting": SensorConfig(
+            name="HP Upper Off Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "hp_lower_off_diff_temp_setting": SensorConfig(
+            name="HP Lower Off Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Electric heating temperature settings
+        "he_upper_on_temp_setting": _temperature(
+            "HE Upper On Temperature Setting"
+        ),
+        "he_lower_on_temp_setting": _temperature(
+            "HE Lower On Temperature Setting"
+        ),
+        "he_upper_off_temp_setting": _temperature(
+            "HE Upper Off Temperature Setting"
+        ),
+        "he_lower_off_temp_setting": _temperature(
+            "HE Lower Off Temperature Setting"
+        ),
+        "he_upper_on_diff_temp_setting": SensorConfig(
+            name="HE Upper On Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "he_lower_on_diff_temp_setting": SensorConfig(
+            name="HE Lower On Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "he_upper_off_diff_temp_setting": SensorConfig(
+            name="HE Upper Off Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        "he_lower_off_diff_temp_setting": SensorConfig(
+            name="HE Lower Off Diff Temperature Setting",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Other temperature settings
+        "heat_min_op_temperature": _temperature(
+            "Heat Min Operating Temperature"
+        ),
+        "freeze_protection_temp_min": _temperature(
+            "Freeze Protection Min Temperature"
+        ),
+        "freeze_protection_temp_max": _temperature(
+            "Freeze Protection Max Temperature"
+        ),
+        "recirculation_temp_setting": _temperature(
+            "Recirculation Temperature Setting", "recirc_temp_setting"
+        ),
+        "recirculation_temperature": _temperature(
+            "Recirculation Temperature", "recirc_temperature"
+        ),
+        "recirculation_faucet_temperature": _temperature(
+            "Recirculation Faucet Temperature", "recirc_faucet_temperature"
+        ),
+        # Flow rate sensors
+        "recirculation_dhw_flow_rate": SensorConfig(
+            attr="recirc_dhw_flow_rate",
+            name="Recirculation DHW Flow Rate",
+            unit=None,
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Operation time sensors
+        "cumulated_evaporator_fan_op_time": SensorConfig(
+            attr="cumulated_op_time_eva_fan",
+            name="Cumulated Evaporator Fan Operation Time",
+            unit="h",
+            device_class="duration",
+            state_class="total_increasing",
+            enabled=False,
+        ),
+        # Anti-legionella and alarm settings
+        "anti_legionella_period": SensorConfig(
+            name="Anti-Legionella Period",
+            unit="d",
+            device_class="duration",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "air_filter_alarm_period": SensorConfig(
+            name="Air Filter Alarm Period",
+            unit="h",
+            device_class="duration",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "air_filter_alarm_elapsed": SensorConfig(
+            name="Air Filter Alarm Elapsed",
+            unit="h",
+            device_class="duration",
+            state_class="measurement",
+            enabled=False,
+        ),
+        # Diagnostic and status sensors
+        "temperature_type": SensorConfig(
+            name="Temperature Type",
+            special="enum_name",
+            enabled=False,
+        ),
+        "temp_formula_type": SensorConfig(
+            name="Temperature Formula Type",
+            special="enum_name",
+            enabled=False,
+        ),
+        "dr_event_status": SensorConfig(
+            name="DR Event Status",
+            special="enum_name",
+            enabled=False,
+        ),
+        "dr_override_status": SensorConfig(
+            name="DR Override Hours Remaining",
+            unit="h",
+            device_class="duration",
+            state_class="measurement",
+            enabled=False,
+        ),
+        "recirculation_error_status": SensorConfig(
+            attr="recirc_error_status",
+            name="Recirculation Error Status",
+            enabled=False,
+        ),
+        "recirculation_operation_reason": SensorConfig(
+            attr="recirc_operation_reason",
+            name="Recirculation Operation Reason",
+            enabled=False,
+        ),
+        "recirculation_operation_mode": SensorConfig(
+            attr="recirc_operation_mode",
+            name="Recirculation Operation Mode",
+            special="enum_name",
+            enabled=False,
+        ),
+        "recirculation_model_type_code": SensorConfig(
+            attr="recirc_model_type_code",
+            name="Recirculation Model Type Code",
+            enabled=False,
+        ),
+        "recirculation_sw_version": SensorConfig(
+            attr="recirc_sw_version",
+            name="Recirculation Software Version",
+            enabled=False,
+        ),
+        "recirculation_temperature_min": _temperature(
+            "Recirculation Minimum Temperature", "recirc_temperature_min"
+        ),
+        "recirculation_temperature_max": _temperature(
+            "Recirculation Maximum Temperature", "recirc_temperature_max"
+        ),
+        "program_reservation_type": SensorConfig(
+            name="Program Reservation Type",
+            enabled=False,
+        ),
+    }
+)
+
+# Smallest change worth a new state for slowly drifting measurements, in
+# the sensor's native unit. Smaller moves are held back until they add up
+# against the last written value, which cuts state and recorder churn.
+SIGNIFICANT_CHANGE: Final = MappingProxyType(
+    {
+        "outside_temperature": 0.5,
+        "tank_upper_temperature": 0.5,
+        "tank_lower_temperature": 0.5,
+        "discharge_temperature": 0.5,
+        "suction_temperature": 0.5,
+        "evaporator_temperature": 0.5,
+        "ambient_temperature": 0.5,
+        "dhw_temperature": 0.5,
+        "dhw_temperature_2": 0.5,
+        "current_inlet_temperature": 0.5,
+        "current_inst_power": 5,
+    }
+)
+
+
+# All device status fields that can be mapped to entities. Every
+# SENSOR_CONFIGS entry reads a DeviceStatus field, so this is the same
+# read-only table the sensor platform is built from.
+DEVICE_STATUS_SENSORS: Final = SENSOR_CONFIGS
+
+
+def _deprecated_dhw_mode_to_ha() -> MappingProxyType[Any, str]:
+    """Resolve the legacy DHW_MODE_TO_HA alias."""
+    warnings.warn(
+        "DHW_MODE_TO_HA is deprecated, use DHW_OPERATION_SETTING_TO_HA",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return DHW_OPERATION_SETTING_TO_HA
+
+
+# Legacy aliases are resolved on first access (PEP 562) so they warn when
+# used, then cached as ordinary module globals so they warn only once.
+_DEPRECATED_ALIASES: Final = MappingProxyType(
+    {
+        "DHW_MODE_TO_HA": _deprecated_dhw_mode_to_ha,
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a legacy module alias on first access (PEP 562)."""
+    if (resolve := _DEPRECATED_ALIASES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = resolve()
+    return value
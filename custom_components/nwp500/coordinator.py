@@ -12,11 +12,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import instance_id as ha_instance_id
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
+from nwp500.enums import DhwOperationSetting
 from nwp500.exceptions import (
     AuthenticationError,
     InvalidCredentialsError,
@@ -25,13 +27,23 @@ from nwp500.exceptions import (
 )
 
 from .const import (
+    ADAPTIVE_BACKOFF_FACTORS,
+    ADAPTIVE_IDLE_POLLS,
+    ADAPTIVE_STANDBY_FACTOR,
+    BURST_CYCLES,
+    BURST_SCAN_INTERVAL,
     CONF_SCAN_INTERVAL,
     CONF_TOKEN_DATA,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     MIN_RECONNECT_INTERVAL,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_TOKENS_PER_MIN,
     SCHEDULE_REFRESH_CYCLES,
     SLOW_UPDATE_THRESHOLD,
+    SLOW_UPDATE_THRESHOLD_NS,
+    get_enum_value,
 )
 from .mqtt_manager import NWP500MqttManager
 
@@ -46,6 +58,30 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status flags that mean a device is heating or drawing hot water right now
+_ACTIVE_STATUS_FLAGS = (
+    "dhw_use",
+    "comp_use",
+    "heat_upper_use",
+    "heat_lower_use",
+)
+# Status fields that decide whether a response counts as a change for
+# adaptive polling. Telemetry such as wifi_rssi, temperatures and power moves
+# a little on almost every poll and would otherwise keep the backoff from
+# ever starting.
+_STATUS_CHANGE_FIELDS = (
+    "operation_mode",
+    "dhw_operation_setting",
+    "dhw_temperature_setting",
+    "operation_busy",
+    "error_code",
+    *_ACTIVE_STATUS_FLAGS,
+)
+# DHW operation settings in which a device sits idle for long stretches
+_STANDBY_SETTINGS = frozenset(
+    {DhwOperationSetting.VACATION, DhwOperationSetting.POWER_OFF}
+)
+
 
 class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching data from the NWP500 API."""
@@ -64,6 +100,9 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.devices: list[Device] = []
         self._devices_by_mac: dict[str, Device] = {}  # O(1) device lookup cache
         self.device_features: dict[str, DeviceFeature] = {}
+        # DeviceInfo shared by a device's entities, with the device and
+        # feature it was built from (see NWP500Entity._shared_device_info)
+        self.device_info_cache: dict[str, tuple[Any, Any, DeviceInfo]] = {}
         self.reservation_schedules: dict[str, dict[str, Any]] = {}
         self.tou_schedules: dict[str, dict[str, Any]] = {}
         self._reconnect_task: asyncio.Task[Any] | None = (
@@ -117,12 +156,118 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
 
+        # Adaptive polling state (see _adapt_update_interval). The interval
+        # is tracked here as well so adapting it never has to read back the
+        # base class property.
+        self._scan_interval = timedelta(seconds=scan_interval)
+        self._poll_interval = self._scan_interval
+        self._idle_polls: int = 0
+        self._status_changed: bool = True
+        self._burst_polls: int = 0
+        # Status request token buckets: MAC -> (tokens, monotonic timestamp)
+        self._request_tokens: dict[str, tuple[float, float]] = {}
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=self._scan_interval,
+        )
+
+    def _set_poll_interval(self, interval: timedelta) -> None:
+        """Apply a new polling interval if it differs from the current one."""
+        if interval == self._poll_interval:
+            return
+        _LOGGER.debug(
+            "Polling interval changed from %ss to %ss",
+            self._poll_interval.total_seconds(),
+            interval.total_seconds(),
+        )
+        self._poll_interval = interval
+        self.update_interval = interval
+
+    def _target_poll_interval(self) -> timedelta:
+        """Return the polling interval for the current idle count and state.
+
+        Unchanged polls back the interval off along ADAPTIVE_BACKOFF_FACTORS.
+        Device state then overrides that: any device heating or drawing hot
+        water holds the configured interval, and all devices in vacation or
+        powered off keep it at least ADAPTIVE_STANDBY_FACTOR times longer.
+        A burst after a control command overrides both.
+        """
+        if self._burst_polls:
+            return min(
+                timedelta(seconds=BURST_SCAN_INTERVAL), self._scan_interval
+            )
+
+        statuses = [
+            status
+            for device_data in (self.data or {}).values()
+            if (status := device_data.get("status")) is not None
+        ]
+        if any(
+            getattr(status, flag, False)
+            for status in statuses
+            for flag in _ACTIVE_STATUS_FLAGS
+        ):
+            return self._scan_interval
+
+        step = min(
+            self._idle_polls // ADAPTIVE_IDLE_POLLS,
+            len(ADAPTIVE_BACKOFF_FACTORS) - 1,
+        )
+        factor = ADAPTIVE_BACKOFF_FACTORS[step]
+        if statuses and all(
+            get_enum_value(getattr(status, "dhw_operation_setting", None))
+            in _STANDBY_SETTINGS
+            for status in statuses
+        ):
+            factor = max(factor, ADAPTIVE_STANDBY_FACTOR)
+
+        ceiling = max(timedelta(seconds=MAX_SCAN_INTERVAL), self._scan_interval)
+        return min(self._scan_interval * factor, ceiling)
+
+    def _adapt_update_interval(self) -> None:
+        """Adjust the polling interval to device activity.
+
+        Runs once per poll cycle before the status requests go out, so it
+        judges the responses to the previous cycle's requests.
+        """
+        if self._status_changed:
+            self._idle_polls = 0
+        else:
+            self._idle_polls += 1
+        self._status_changed = False
+        self._set_poll_interval(self._target_poll_interval())
+        if self._burst_polls:
+            self._burst_polls -= 1
+
+    def _start_burst_polling(self) -> None:
+        """Poll quickly for a few cycles so a command's effect shows soon."""
+        self._burst_polls = BURST_CYCLES
+        self._idle_polls = 0
+        self._set_poll_interval(self._target_poll_interval())
+
+    def _take_request_token(self, mac_address: str) -> bool:
+        """Spend a status request token for a device, if one is available.
+
+        Returns:
+            True if the request may be sent, False if the device is over
+            its RATE_LIMIT_TOKENS_PER_MIN budget
+        """
+        now = time.monotonic()
+        tokens, last = self._request_tokens.get(
+            mac_address, (float(RATE_LIMIT_BURST), now)
         )
+        tokens = min(
+            float(RATE_LIMIT_BURST),
+            tokens + (now - last) * RATE_LIMIT_TOKENS_PER_MIN / 60,
+        )
+        if tokens < 1:
+            self._request_tokens[mac_address] = (tokens, now)
+            return False
+        self._request_tokens[mac_address] = (tokens - 1, now)
+        return True
 
     def _update_device_cache(self) -> None:
         """Update the devices-by-MAC lookup cache for O(1) access.
@@ -260,7 +405,7 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 pass
 
         # Track performance metrics
-        start_time = time.monotonic()
+        start_ns = time.monotonic_ns()
 
         if not self.auth_client:
             await self._setup_clients()
@@ -332,10 +477,21 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._consecutive_timeouts = 0
         self._mqtt_connected_since = current_connected_since
 
+        self._adapt_update_interval()
+
         try:
             for device in self.devices:
                 mac_address = device.device_info.mac_address
 
+                if not self._take_request_token(mac_address):
+                    _LOGGER.debug(
+                        "Skipping status request for %s: rate limit of "
+                        "%d requests/min reached",
+                        mac_address,
+                        RATE_LIMIT_TOKENS_PER_MIN,
+                    )
+                    continue
+
                 # Request fresh status via MQTT (async, will update)
                 if self.mqtt_manager:
                     try:
@@ -491,7 +647,8 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         )
 
             # Calculate and log performance metrics
-            duration = time.monotonic() - start_time
+            elapsed_ns = time.monotonic_ns() - start_ns
+            duration = elapsed_ns / 1_000_000_000
             self._update_count += 1
             self._total_update_time += duration
 
@@ -512,7 +669,7 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             # Warn if update is unusually slow
-            if duration > SLOW_UPDATE_THRESHOLD:
+            if elapsed_ns > SLOW_UPDATE_THRESHOLD_NS:
                 _LOGGER.warning(
                     "Slow coordinator update detected: %.2fs "
                     "(threshold: %.1fs). This may indicate network "
@@ -525,7 +682,7 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         except Exception as err:
             # Track failed update time as well
-            duration = time.monotonic() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1_000_000_000
             _LOGGER.error(
                 "Error fetching data after %.2fs: %s",
                 duration,
@@ -814,6 +971,13 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
             if self.data is not None:
+                previous = self.data.get(mac_address, {}).get("status")
+                changed = previous is None or any(
+                    getattr(status, field, None)
+                    != getattr(previous, field, None)
+                    for field in _STATUS_CHANGE_FIELDS
+                )
+
                 if mac_address not in self.data:
                     # Create device entry if device is known but not in data
                     device = self._devices_by_mac.get(mac_address)
@@ -833,6 +997,10 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     self.data[mac_address]["status"] = status
                     self.data[mac_address]["last_update"] = time.time()
 
+                if changed:
+                    # _adapt_update_interval drops the backoff on its next run
+                    self._status_changed = True
+
                 # Notify all listeners that data has changed
                 self.async_update_listeners()
 
@@ -946,7 +1114,11 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_control_device(
         self, mac_address: str, command: str, **kwargs: Any
     ) -> bool:
-        """Send control command to device."""
+        """Send control command to device.
+
+        A successful command starts a short burst of fast polls so the
+        entities catch up with the device without waiting a full interval.
+        """
         if not self.mqtt_manager:
             _LOGGER.error("MQTT manager not available")
             return False
@@ -957,7 +1129,11 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Device %s not found", mac_address)
             return False
 
-        return await self.mqtt_manager.send_command(device, command, **kwargs)
+        if success := await self.mqtt_manager.send_command(
+            device, command, **kwargs
+        ):
+            self._start_burst_polling()
+        return success
 
     async def async_request_device_info(
         self, mac_address: str | None = None
@@ -1227,17 +1403,7 @@ class NWP500DataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             True if command was sent successfully
         """
-        if not self.mqtt_manager:
-            _LOGGER.error("MQTT manager not available")
-            return False
-
-        device = self._devices_by_mac.get(mac_address)
-
-        if not device:
-            _LOGGER.error("Device %s not found", mac_address)
-            return False
-
-        return await self.mqtt_manager.send_command(device, command, **kwargs)
+        return await self.async_control_device(mac_address, command, **kwargs)
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
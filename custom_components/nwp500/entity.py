@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, override
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, STALE_DATA_THRESHOLD
+from .const import DOMAIN, MANUFACTURER, MODEL, STALE_DATA_THRESHOLD
 from .coordinator import NWP500DataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -35,7 +35,7 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
         self._last_seen_update: float | None = None
 
         # Build device info with available information
-        self._attr_device_info = self._build_device_info()
+        self._attr_device_info = self._shared_device_info()
 
         # Set initial attribute states
         self._update_attrs()
@@ -58,9 +58,33 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
         )
 
         if feature_changed:
-            self._attr_device_info = self._build_device_info()
+            self._attr_device_info = self._shared_device_info()
             self._last_feature_update = current_feature
 
+    def _shared_device_info(self) -> DeviceInfo:
+        """Return the DeviceInfo shared by every entity of this device.
+
+        The coordinator caches it per MAC, keyed on the device and feature
+        objects it was built from, so it is rebuilt only when either changes
+        and is dropped together with the config entry.
+        """
+        cache = self.coordinator.device_info_cache
+        feature = self.coordinator.device_features.get(self.mac_address)
+        cached = cache.get(self.mac_address)
+        if (
+            cached is not None
+            and cached[0] is self.device
+            and cached[1] == feature
+        ):
+            return cached[2]
+        device_info = self._build_device_info()
+        cache[self.mac_address] = (
+            self.device,
+            feature,
+            device_info,
+        )
+        return device_info
+
     @override
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -80,7 +104,16 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
             self._stale_count += 1
 
         self._update_attrs()
-        super()._handle_coordinator_update()
+        if self._should_write_state():
+            super()._handle_coordinator_update()
+
+    def _should_write_state(self) -> bool:
+        """Return whether a coordinator update should be written to HA.
+
+        Platforms override this to drop updates that are not worth a new
+        state. Staleness is tracked before this is asked either way.
+        """
+        return True
 
     @property
     @override
@@ -108,9 +141,9 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
         Returns:
             Device status object or None if unavailable
         """
-        if not self.device_data:
+        if not (device_data := self.device_data):
             return None
-        return self.device_data.get("status")
+        return device_data.get("status")
 
     def _get_status_attrs(self, *attrs: str) -> dict[str, Any]:
         """Efficiently get multiple status attributes at once.
@@ -137,7 +170,7 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
         serial_number = None
         sw_version = None
         hw_version = None
-        model_name = "NWP500"
+        model_name = MODEL
         configuration_url = None
         suggested_area = "Utility Room"
 
@@ -214,7 +247,7 @@ class NWP500Entity(CoordinatorEntity[NWP500DataUpdateCoordinator]):
         return DeviceInfo(
             identifiers={(DOMAIN, self.mac_address)},
             name=device_name,
-            manufacturer="Navien",
+            manufacturer=MANUFACTURER,
             model=model_name,
             serial_number=serial_number,
             hw_version=hw_version,
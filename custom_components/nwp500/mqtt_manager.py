@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 # Reconnection backoff delays (seconds): 2s, 5s, 15s, 30s, 60s cap
-_RECONNECT_BACKOFF_DELAYS: list[float] = [2.0, 5.0, 15.0, 30.0, 60.0]
+_RECONNECT_BACKOFF_DELAYS: tuple[float, ...] = (2.0, 5.0, 15.0, 30.0, 60.0)
 _RECONNECTION_FAILED_EVENT = "reconnection_failed"
 
 
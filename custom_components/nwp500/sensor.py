@@ -5,7 +5,8 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, override
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -24,7 +25,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import schedule_state
-from .const import DOMAIN, SENSOR_CONFIGS
+from .const import DOMAIN, SENSOR_CONFIGS, SIGNIFICANT_CHANGE
 from .coordinator import NWP500DataUpdateCoordinator
 from .entity import NWP500Entity
 
@@ -40,6 +41,7 @@ class NWP500SensorEntityDescription(SensorEntityDescription):
 
     attr_name: str | None = None
     value_fn: Callable[[Any], Any] | None = None
+    significant_change: float = 0
 
 
 def create_sensor_descriptions() -> tuple[NWP500SensorEntityDescription, ...]:
@@ -81,16 +83,23 @@ def create_sensor_descriptions() -> tuple[NWP500SensorEntityDescription, ...]:
         "total": SensorStateClass.TOTAL,
     }
 
+    # Default precision by device class if not explicitly set
+    default_precision: dict[str, int] = {
+        "temperature": 1,
+        "power": 0,
+        "energy": 0,
+        "energy_storage": 0,
+    }
+
     for key, config in SENSOR_CONFIGS.items():
-        if not isinstance(config, dict):
-            continue
-        attr_name: str = config["attr"]
+        attr_name = config.attr or key
 
         # Check if this is a text/enum sensor (no numeric value)
-        is_enum_sensor = config.get("special") == "enum_name"
-        is_boolean_sensor = config.get("special") == "boolean"
+        is_enum_sensor = config.special == "enum_name"
+        is_boolean_sensor = config.special == "boolean"
 
         # Determine the value function based on special handling needs
+        value_fn: Callable[[Any], Any]
         if is_enum_sensor:
             # Special handling for enum types that need .name extraction
             def _make_enum_value_fn(attr: str) -> Callable[[Any], str | None]:
@@ -120,54 +129,36 @@ def create_sensor_descriptions() -> tuple[NWP500SensorEntityDescription, ...]:
 
             value_fn = _make_boolean_value_fn(attr_name)
         else:
-            # Standard attribute getter
-            def _make_standard_value_fn(attr: str) -> Callable[[Any], Any]:
-                def value_fn(status: Any) -> Any:
-                    return getattr(status, attr, None)
-
-                return value_fn  # noqa: B023
-
-            value_fn = _make_standard_value_fn(attr_name)
+            # Standard attribute getter. attrgetter runs in C; a missing
+            # attribute raises AttributeError, which native_value maps to None.
+            value_fn = attrgetter(attr_name)
 
         # Get unit - None for enum/boolean sensors to prevent numeric interpretation
-        unit = config.get("unit")
+        unit = config.unit
         if is_enum_sensor or is_boolean_sensor or not unit:
             native_unit = None
         else:
             native_unit = unit_map.get(str(unit), str(unit))
 
-        # Default precision by device class if not explicitly set
-        default_precision: dict[str, int] = {
-            "temperature": 1,
-            "power": 0,
-            "energy": 0,
-            "energy_storage": 0,
-        }
-        precision: int | None = config.get(
-            "precision",
-            default_precision.get(str(config.get("device_class", ""))),
-        )
+        precision = config.precision
+        if precision is None:
+            precision = default_precision.get(str(config.device_class))
 
         descriptions.append(
             NWP500SensorEntityDescription(
                 key=key,
                 attr_name=attr_name,
                 translation_key=key,
-                device_class=device_class_map.get(
-                    str(config.get("device_class", ""))
-                ),
-                state_class=state_class_map.get(
-                    str(config.get("state_class", ""))
-                ),
+                device_class=device_class_map.get(str(config.device_class)),
+                state_class=state_class_map.get(str(config.state_class)),
                 native_unit_of_measurement=native_unit,
-                entity_registry_enabled_default=bool(
-                    config.get("enabled", False)
-                ),
+                entity_registry_enabled_default=config.enabled,
                 suggested_display_precision=precision,
                 entity_category=entity_category_map.get(
-                    str(config.get("entity_category", ""))
+                    str(config.entity_category)
                 ),
                 value_fn=value_fn,
+                significant_change=SIGNIFICANT_CHANGE.get(key, 0),
             )
         )
 
@@ -246,6 +237,33 @@ class NWP500Sensor(NWP500Entity, SensorEntity):  # type: ignore[reportIncompatib
         super().__init__(coordinator, mac_address, device)
         self.entity_description = description
         self._attr_unique_id = f"{mac_address}_{description.key}"
+        # Availability, value and attributes as last written to HA
+        self._written_state: tuple[bool, Any, Any] | None = None
+
+    @override
+    def _should_write_state(self) -> bool:
+        """Hold back numeric moves smaller than the significant change."""
+        tolerance = getattr(self.entity_description, "significant_change", 0)
+        if not tolerance:
+            return True
+        state = (
+            self.available,
+            self.native_value,
+            self._attr_extra_state_attributes,
+        )
+        if (written := self._written_state) is not None:
+            available, value, attributes = written
+            if (
+                available
+                and state[0]
+                and state[2] == attributes
+                and isinstance(value, int | float)
+                and isinstance(state[1], int | float)
+                and abs(state[1] - value) < tolerance
+            ):
+                return False
+        self._written_state = state
+        return True
 
     @property
     def native_unit_of_measurement(self) -> str | None:  # type: ignore[reportIncompatibleVariableOverride,unused-ignore]
@@ -439,7 +439,7 @@ class NWP500WaterHeater(NWP500Entity, WaterHeaterEntity, RestoreEntity):  # type
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the water heater off by setting to power off mode."""
         # Use DHW mode 6 (POWER_OFF) instead of the uncertain set_power method
-        # This maps to the "off" operation mode in our DHW_MODE_TO_HA mapping
+        # This maps to the "off" state in DHW_OPERATION_SETTING_TO_HA
         await self._control_device(
             "set_dhw_mode",
             "Failed to set water heater to power off mode",
@@ -218,4 +218,5 @@ def mock_coordinator(
     # Mock device_features to return None (no features available)
     coordinator.device_features = MagicMock()
     coordinator.device_features.get.return_value = None
+    coordinator.device_info_cache = {}
     return coordinator
@@ -184,3 +184,38 @@ class TestNWP500BinarySensor:
         )
 
         assert sensor.is_on is None
+
+    def test_descriptions_read_a_status_attribute(self):
+        """Every description names a unique key and a status attribute."""
+        from custom_components.nwp500.binary_sensor import (
+            create_binary_sensor_descriptions,
+        )
+
+        descriptions = create_binary_sensor_descriptions()
+        keys = [d.key for d in descriptions]
+
+        assert len(keys) == len(set(keys))
+        assert all(d.attr for d in descriptions)
+        assert all(d.translation_key == d.key for d in descriptions)
+
+    def test_descriptions_map_device_classes(self):
+        """Device class names in the const table become HA device classes."""
+        from homeassistant.components.binary_sensor import (
+            BinarySensorDeviceClass,
+        )
+
+        from custom_components.nwp500.binary_sensor import (
+            create_binary_sensor_descriptions,
+        )
+
+        by_key = {d.key: d for d in create_binary_sensor_descriptions()}
+
+        assert (
+            by_key["operation_busy"].device_class
+            is BinarySensorDeviceClass.RUNNING
+        )
+        assert (
+            by_key["wtr_ovr_sensor_use"].device_class
+            is BinarySensorDeviceClass.SAFETY
+        )
+        assert by_key["tou_status"].device_class is None
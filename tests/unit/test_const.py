@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import pytest
 from nwp500.enums import CurrentOperationMode, DhwOperationSetting
 
 from custom_components.nwp500.const import (
     CURRENT_OPERATION_MODE_TO_HA,
+    DEVICE_STATUS_SENSORS,
     DHW_OPERATION_SETTING_TO_HA,
     DOMAIN,
     HA_TO_DHW_MODE,
+    HA_TO_DHW_OPERATION_SETTING,
     MAX_TEMPERATURE_C,
     MAX_TEMPERATURE_F,
     MIN_TEMPERATURE_C,
     MIN_TEMPERATURE_F,
+    SENSOR_CONFIGS,
+    get_current_operation_mode_state,
+    get_dhw_operation_setting_state,
     get_enum_value,
 )
 
@@ -70,6 +76,34 @@ def test_current_operation_mode_mapping():
     # Electric mode is in DHW settings, not current operation mode
 
 
+def test_get_current_operation_mode_state():
+    """Test the indexed CurrentOperationMode lookup and its fallbacks."""
+    for mode, state in CURRENT_OPERATION_MODE_TO_HA.items():
+        assert get_current_operation_mode_state(mode) == state
+        assert get_current_operation_mode_state(mode.value) == state
+
+    assert get_current_operation_mode_state(33) == "mode_33"
+    assert get_current_operation_mode_state(128) == "mode_128"
+    assert get_current_operation_mode_state(-32) == "mode_-32"
+    assert get_current_operation_mode_state("32") == "mode_32"
+    assert get_current_operation_mode_state(None, "unknown") == "unknown"
+
+
+def test_get_current_operation_mode_state_accepts_int_subclasses():
+    """Test ints that are not the library enum still take the indexed path."""
+
+    class _Code(int):
+        pass
+
+    assert get_current_operation_mode_state(_Code(64)) == "eco"
+    assert get_current_operation_mode_state(False) == "standby"
+    assert (
+        get_current_operation_mode_state(CurrentOperationMode.HEAT_PUMP_MODE)
+        == "heat_pump"
+    )
+    assert get_current_operation_mode_state(96) == "high_demand"
+
+
 def test_dhw_operation_setting_mapping():
     """Test DHW operation setting to HA state mapping."""
     assert (
@@ -92,6 +126,33 @@ def test_dhw_operation_setting_mapping():
     assert DHW_OPERATION_SETTING_TO_HA[DhwOperationSetting.POWER_OFF] == "off"
 
 
+def test_get_dhw_operation_setting_state():
+    """Test the indexed DhwOperationSetting lookup and its fallbacks."""
+    for setting, state in DHW_OPERATION_SETTING_TO_HA.items():
+        assert get_dhw_operation_setting_state(setting) == state
+        assert get_dhw_operation_setting_state(setting.value) == state
+
+    assert get_dhw_operation_setting_state(0) == "mode_0"
+    assert get_dhw_operation_setting_state(7) == "mode_7"
+    assert get_dhw_operation_setting_state(-1) == "mode_-1"
+    assert get_dhw_operation_setting_state(None, "unknown") == "unknown"
+
+
+def test_get_dhw_operation_setting_state_accepts_int_subclasses():
+    """Test ints that are not the library enum still take the indexed path."""
+
+    class _Code(int):
+        pass
+
+    assert get_dhw_operation_setting_state(_Code(3)) == "eco"
+    assert get_dhw_operation_setting_state(True) == "heat_pump"
+    assert (
+        get_dhw_operation_setting_state(DhwOperationSetting.VACATION)
+        == "vacation"
+    )
+    assert get_dhw_operation_setting_state(6) == "off"
+
+
 def test_ha_to_dhw_mode_mapping():
     """Test HA state to DHW mode mapping."""
     assert HA_TO_DHW_MODE["eco"] == 3
@@ -110,3 +171,43 @@ def test_mode_mappings_are_bidirectional():
     for dhw_value, ha_state in DHW_OPERATION_SETTING_TO_HA.items():
         if ha_state in HA_TO_DHW_MODE:
             assert HA_TO_DHW_MODE[ha_state] == dhw_value
+
+
+def test_ha_to_dhw_operation_setting_inverts_forward_map():
+    """Test the reverse map is the forward map minus power_off."""
+    assert HA_TO_DHW_OPERATION_SETTING == {
+        state: setting
+        for setting, state in DHW_OPERATION_SETTING_TO_HA.items()
+        if setting != DhwOperationSetting.POWER_OFF
+    }
+    assert HA_TO_DHW_OPERATION_SETTING["vacation"] == 5
+    assert "off" not in HA_TO_DHW_OPERATION_SETTING
+
+
+def test_device_status_sensors_follow_sensor_configs():
+    """Test the status sensor table is built at import from SENSOR_CONFIGS."""
+    from custom_components.nwp500 import const
+
+    assert "DEVICE_STATUS_SENSORS" in vars(const)
+    for key, config in DEVICE_STATUS_SENSORS.items():
+        assert config is SENSOR_CONFIGS[key]
+
+
+def test_sensor_config_attrs_are_snake_case():
+    """Test every sensor reads a snake_case DeviceStatus attribute."""
+    for key, config in SENSOR_CONFIGS.items():
+        attr = config.attr or key
+        assert attr == attr.lower(), key
+        assert attr.isidentifier(), key
+
+
+def test_dhw_mode_to_ha_is_a_deprecated_alias():
+    """Test the legacy alias warns and resolves to the current mapping."""
+    from custom_components.nwp500 import const
+
+    vars(const).pop("DHW_MODE_TO_HA", None)
+
+    with pytest.warns(DeprecationWarning, match="DHW_MODE_TO_HA"):
+        alias = const.DHW_MODE_TO_HA
+
+    assert alias is DHW_OPERATION_SETTING_TO_HA
@@ -1,6 +1,8 @@
 """Tests for NWP500DataUpdateCoordinator."""
 
+import logging
 import time
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,6 +10,9 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.nwp500.coordinator import NWP500DataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from nwp500 import DeviceStatus
+
 
 @pytest.fixture
 def mock_entry():
@@ -41,6 +46,37 @@ def _make_disconnected_mqtt_manager(
     return mgr
 
 
+def _idle_status(**overrides) -> DeviceStatus:
+    """Return a real status for a device that is on but not heating.
+
+    Built with model_construct so only the fields polling looks at, plus
+    some telemetry, need filling in; equality is still pydantic's own.
+    """
+    from nwp500 import DeviceStatus
+    from nwp500.enums import (
+        CurrentOperationMode,
+        DhwOperationSetting,
+        ErrorCode,
+    )
+
+    fields = {
+        "operation_mode": CurrentOperationMode.STANDBY,
+        "dhw_operation_setting": DhwOperationSetting.HEAT_PUMP,
+        "dhw_temperature_setting_raw": 100,
+        "operation_busy": False,
+        "error_code": ErrorCode.NO_ERROR,
+        "dhw_use": False,
+        "comp_use": False,
+        "heat_upper_use": False,
+        "heat_lower_use": False,
+        "wifi_rssi": -60,
+        "tank_upper_temperature_raw": 500,
+        "current_inst_power": 0.0,
+    }
+    fields.update(overrides)
+    return DeviceStatus.model_construct(**fields)
+
+
 def test_on_device_status_update_schedules_loop_task(coordinator, mock_hass):
     """Test that _on_device_status_update schedules a task in the event loop."""
     mac = "AA:BB:CC:DD:EE:FF"
@@ -238,7 +274,7 @@ async def test_async_update_triggers_force_reconnect_after_request_timeouts(
 
 @pytest.mark.asyncio
 async def test_async_update_skips_force_reconnect_within_min_interval(
-    coordinator, mock_hass
+    coordinator, mock_hass, caplog
 ):
     """Rate-limited reconnection attempts skip but don't reset timeout counter."""
     device = MagicMock()
@@ -262,11 +298,13 @@ async def test_async_update_skips_force_reconnect_within_min_interval(
     mock_hass.config.units.temperature_unit = "°F"
     coordinator.unit_system = "us_customary"
 
+    caplog.set_level(logging.DEBUG, logger="custom_components.nwp500")
     with patch("nwp500.unit_system.set_unit_system"):
         await coordinator._async_update_data()
 
     # Reconnection should not be attempted due to rate limiting (5s < 30s)
     coordinator.mqtt_manager.force_reconnect.assert_not_called()
+    assert "Skipping reconnection - last attempt 5s ago" in caplog.text
     # Counter should accumulate to 3 (not reset during rate limit)
     assert coordinator._consecutive_timeouts == 3
 
@@ -346,6 +384,36 @@ async def test_async_update_resets_consecutive_timeouts_on_successful_request(
     assert coordinator._consecutive_timeouts == 0
 
 
+@pytest.mark.asyncio
+async def test_async_update_warns_when_slow(coordinator, mock_hass, caplog):
+    """An update slower than SLOW_UPDATE_THRESHOLD logs a formatted warning."""
+    from custom_components.nwp500.const import SLOW_UPDATE_THRESHOLD_NS
+
+    coordinator.devices = []
+    coordinator.data = {}
+    coordinator.auth_client = AsyncMock()
+    coordinator.mqtt_manager = MagicMock()
+    coordinator.mqtt_manager.is_connected = True
+
+    mock_hass.config.units.temperature_unit = "°F"
+    coordinator.unit_system = "us_customary"
+
+    clock = iter((0, SLOW_UPDATE_THRESHOLD_NS + 1_000_000_000))
+    with (
+        patch("nwp500.unit_system.set_unit_system"),
+        patch(
+            "custom_components.nwp500.coordinator.time.monotonic_ns",
+            side_effect=lambda: next(clock),
+        ),
+    ):
+        await coordinator._async_update_data()
+
+    assert (
+        "Slow coordinator update detected: 16.00s (threshold: 15.0s)"
+        in caplog.text
+    )
+
+
 @pytest.mark.asyncio
 async def test_async_update_starts_reauth_after_library_reconnect_failure(
     coordinator, mock_hass
@@ -367,3 +435,256 @@ async def test_async_update_starts_reauth_after_library_reconnect_failure(
 
     coordinator.entry.async_start_reauth.assert_called_once_with(mock_hass)
     assert coordinator._mqtt_reconnection_failed_attempts is None
+
+
+def test_adapt_update_interval_backs_off_while_status_is_unchanged(
+    coordinator,
+):
+    """Unchanged polls stretch the interval step by step up to the cap."""
+    from datetime import timedelta
+
+    from custom_components.nwp500.const import (
+        ADAPTIVE_IDLE_POLLS,
+        MAX_SCAN_INTERVAL,
+    )
+
+    base = coordinator._scan_interval
+    coordinator._status_changed = False
+
+    for _ in range(ADAPTIVE_IDLE_POLLS - 1):
+        coordinator._adapt_update_interval()
+    assert coordinator._poll_interval == base
+
+    coordinator._adapt_update_interval()
+    assert coordinator._poll_interval > base
+    assert coordinator.update_interval == coordinator._poll_interval
+
+    for _ in range(ADAPTIVE_IDLE_POLLS * 10):
+        coordinator._adapt_update_interval()
+    assert coordinator._poll_interval == timedelta(seconds=MAX_SCAN_INTERVAL)
+
+
+def test_status_change_restores_configured_interval(coordinator):
+    """A change in an operating field drops back to the scan interval."""
+    from nwp500.enums import DhwOperationSetting
+
+    from custom_components.nwp500.const import ADAPTIVE_IDLE_POLLS
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    coordinator.data = {
+        mac: {"device": MagicMock(), "status": _idle_status(), "last_update": 0}
+    }
+    coordinator.async_update_listeners = MagicMock()
+    coordinator._status_changed = False
+    for _ in range(ADAPTIVE_IDLE_POLLS):
+        coordinator._adapt_update_interval()
+    assert coordinator._poll_interval > coordinator._scan_interval
+
+    coordinator._handle_status_update_in_loop(
+        mac, _idle_status(dhw_operation_setting=DhwOperationSetting.ELECTRIC)
+    )
+    assert coordinator._status_changed is True
+
+    coordinator._adapt_update_interval()
+    assert coordinator._poll_interval == coordinator._scan_interval
+    assert coordinator._idle_polls == 0
+
+
+def test_telemetry_noise_does_not_reset_backoff(coordinator):
+    """Statuses differing only in RSSI, temperature or power count as idle."""
+    mac = "AA:BB:CC:DD:EE:FF"
+    previous = _idle_status()
+    status = _idle_status(
+        wifi_rssi=-63, tank_upper_temperature_raw=502, current_inst_power=4.0
+    )
+    assert status != previous  # pydantic compares every field
+    coordinator.data = {
+        mac: {"device": MagicMock(), "status": previous, "last_update": 0}
+    }
+    coordinator.async_update_listeners = MagicMock()
+    coordinator._status_changed = False
+    coordinator._idle_polls = 5
+
+    coordinator._handle_status_update_in_loop(mac, status)
+
+    assert coordinator._status_changed is False
+    assert coordinator._idle_polls == 5
+    assert coordinator.data[mac]["status"] is status
+
+
+def test_backoff_engages_with_noisy_statuses(coordinator):
+    """The interval stretches while only telemetry keeps changing."""
+    from custom_components.nwp500.const import ADAPTIVE_IDLE_POLLS
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    coordinator.data = {
+        mac: {"device": MagicMock(), "status": None, "last_update": None}
+    }
+    coordinator.async_update_listeners = MagicMock()
+
+    for poll in range(ADAPTIVE_IDLE_POLLS + 2):
+        coordinator._adapt_update_interval()
+        coordinator._handle_status_update_in_loop(
+            mac,
+            _idle_status(
+                wifi_rssi=-60 - poll % 3,
+                tank_upper_temperature_raw=500 + poll,
+                current_inst_power=float(poll),
+            ),
+        )
+
+    assert coordinator._poll_interval > coordinator._scan_interval
+
+
+def test_idle_device_reaches_max_interval_with_noisy_statuses(coordinator):
+    """A quiet tank ends up polling at MAX_SCAN_INTERVAL, not the default."""
+    from datetime import timedelta
+
+    from custom_components.nwp500.const import (
+        ADAPTIVE_BACKOFF_FACTORS,
+        ADAPTIVE_IDLE_POLLS,
+        DEFAULT_SCAN_INTERVAL,
+        MAX_SCAN_INTERVAL,
+    )
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    coordinator.data = {
+        mac: {"device": MagicMock(), "status": None, "last_update": None}
+    }
+    coordinator.async_update_listeners = MagicMock()
+    assert coordinator._scan_interval == timedelta(
+        seconds=DEFAULT_SCAN_INTERVAL
+    )
+
+    polls = ADAPTIVE_IDLE_POLLS * len(ADAPTIVE_BACKOFF_FACTORS) + 2
+    for poll in range(polls):
+        coordinator._adapt_update_interval()
+        coordinator._handle_status_update_in_loop(
+            mac,
+            _idle_status(
+                wifi_rssi=-55 - poll % 7,
+                tank_upper_temperature_raw=500 - poll % 4,
+                current_inst_power=float(poll % 2),
+            ),
+        )
+
+    assert coordinator._poll_interval == timedelta(seconds=MAX_SCAN_INTERVAL)
+    assert coordinator.update_interval == coordinator._poll_interval
+
+
+def test_active_device_holds_configured_interval(coordinator):
+    """A device that is heating keeps polling at the scan interval."""
+    from custom_components.nwp500.const import ADAPTIVE_IDLE_POLLS
+
+    coordinator.data = {
+        "AA:BB:CC:DD:EE:FF": {
+            "device": MagicMock(),
+            "status": _idle_status(comp_use=True),
+            "last_update": 0,
+        }
+    }
+    coordinator._status_changed = False
+
+    for _ in range(ADAPTIVE_IDLE_POLLS * 3):
+        coordinator._adapt_update_interval()
+
+    assert coordinator._poll_interval == coordinator._scan_interval
+
+
+def test_standby_devices_poll_slower(coordinator):
+    """Vacation or powered-off devices poll at least ADAPTIVE_STANDBY_FACTOR slower."""
+    from nwp500.enums import DhwOperationSetting
+
+    from custom_components.nwp500.const import ADAPTIVE_STANDBY_FACTOR
+
+    coordinator.data = {
+        "AA:BB:CC:DD:EE:FF": {
+            "device": MagicMock(),
+            "status": _idle_status(
+                dhw_operation_setting=DhwOperationSetting.VACATION
+            ),
+            "last_update": 0,
+        },
+        "AA:BB:CC:DD:EE:00": {
+            "device": MagicMock(),
+            "status": _idle_status(
+                dhw_operation_setting=DhwOperationSetting.POWER_OFF
+            ),
+            "last_update": 0,
+        },
+    }
+
+    coordinator._adapt_update_interval()
+
+    assert coordinator._poll_interval == (
+        coordinator._scan_interval * ADAPTIVE_STANDBY_FACTOR
+    )
+
+
+@pytest.mark.asyncio
+async def test_control_command_starts_burst_polling(coordinator):
+    """A successful command polls fast for BURST_CYCLES cycles."""
+    from datetime import timedelta
+
+    from custom_components.nwp500.const import (
+        BURST_CYCLES,
+        BURST_SCAN_INTERVAL,
+    )
+
+    mac = "AA:BB:CC:DD:EE:FF"
+    coordinator._devices_by_mac = {mac: MagicMock()}
+    coordinator.mqtt_manager = MagicMock()
+    coordinator.mqtt_manager.send_command = AsyncMock(return_value=True)
+    coordinator._idle_polls = 10
+
+    assert await coordinator.async_control_device(mac, "set_power")
+
+    burst = timedelta(seconds=BURST_SCAN_INTERVAL)
+    assert coordinator._poll_interval == burst
+    assert coordinator._idle_polls == 0
+
+    for _ in range(BURST_CYCLES):
+        coordinator._adapt_update_interval()
+        assert coordinator._poll_interval == burst
+
+    coordinator._adapt_update_interval()
+    assert coordinator._poll_interval == coordinator._scan_interval
+
+
+@pytest.mark.asyncio
+async def test_failed_control_command_does_not_burst(coordinator):
+    """A rejected command leaves the polling interval alone."""
+    mac = "AA:BB:CC:DD:EE:FF"
+    coordinator._devices_by_mac = {mac: MagicMock()}
+    coordinator.mqtt_manager = MagicMock()
+    coordinator.mqtt_manager.send_command = AsyncMock(return_value=False)
+
+    assert not await coordinator.async_control_device(mac, "set_power")
+
+    assert coordinator._burst_polls == 0
+    assert coordinator._poll_interval == coordinator._scan_interval
+
+
+def test_take_request_token_limits_bursts(coordinator):
+    """Each device may burst RATE_LIMIT_BURST requests, then is throttled."""
+    from custom_components.nwp500.const import RATE_LIMIT_BURST
+
+    for _ in range(RATE_LIMIT_BURST):
+        assert coordinator._take_request_token("aabbcc001122")
+    assert not coordinator._take_request_token("aabbcc001122")
+
+    # Buckets are per device
+    assert coordinator._take_request_token("aabbcc334455")
+
+
+def test_take_request_token_refills_over_time(coordinator):
+    """Tokens come back at RATE_LIMIT_TOKENS_PER_MIN."""
+    from custom_components.nwp500.const import RATE_LIMIT_TOKENS_PER_MIN
+
+    coordinator._request_tokens["aabbcc001122"] = (
+        0.0,
+        time.monotonic() - 60 / RATE_LIMIT_TOKENS_PER_MIN,
+    )
+
+    assert coordinator._take_request_token("aabbcc001122")
+    assert not coordinator._take_request_token("aabbcc001122")
@@ -96,6 +96,32 @@ class TestNWP500Entity:
         assert device_info["model"] == "NWP500"  # No volume code
         assert device_info["sw_version"] == "2.0.0"  # Only controller version
 
+    def test_device_info_is_shared_between_entities(
+        self,
+        mock_coordinator: MagicMock,
+        mock_device: MagicMock,
+    ):
+        """Entities of one device share a DeviceInfo until features change."""
+        mac_address = mock_device.device_info.mac_address
+        first = NWP500Entity(mock_coordinator, mac_address, mock_device)
+        second = NWP500Entity(mock_coordinator, mac_address, mock_device)
+
+        assert second.device_info is first.device_info
+        # Cached on the coordinator, so it goes away with the config entry
+        assert (
+            mock_coordinator.device_info_cache[mac_address][2]
+            is first.device_info
+        )
+
+        mock_feature = MagicMock()
+        mock_feature.controller_serial_number = "SN123456"
+        mock_feature.volume_code = None
+        mock_coordinator.device_features.get.return_value = mock_feature
+        third = NWP500Entity(mock_coordinator, mac_address, mock_device)
+
+        assert third.device_info is not first.device_info
+        assert third.device_info["serial_number"] == "SN123456"
+
     def test_status_property(
         self,
         mock_coordinator: MagicMock,
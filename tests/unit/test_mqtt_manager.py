@@ -373,7 +373,7 @@ async def test_force_reconnect_handles_cancellation(
         # Use patch to set backoff delays to 0 so task reaches setup() immediately
         with patch(
             "custom_components.nwp500.mqtt_manager._RECONNECT_BACKOFF_DELAYS",
-            [0, 0, 0, 0, 0],
+            (0, 0, 0, 0, 0),
         ):
             await asyncio.sleep(0.1)  # Let task reach setup()
             task.cancel()
@@ -78,6 +78,15 @@ class TestNWP500Sensor:
         # Value will be either the temperature or None if not available
         assert sensor.native_value is not None or sensor.native_value is None
 
+    def test_device_status_sensors_match_created_sensors(self):
+        """DEVICE_STATUS_SENSORS lists exactly the sensors the platform creates."""
+        from custom_components.nwp500.const import DEVICE_STATUS_SENSORS
+        from custom_components.nwp500.sensor import create_sensor_descriptions
+
+        assert set(DEVICE_STATUS_SENSORS) == {
+            d.key for d in create_sensor_descriptions()
+        }
+
     def test_energy_sensors(
         self,
         mock_coordinator: MagicMock,
@@ -129,6 +138,19 @@ class TestNWP500Sensor:
         assert by_key["energy_to_setpoint"].device_class is None
         assert by_key["full_recovery_energy"].device_class is None
 
+    def test_sensor_attr_name_defaults_to_key(self):
+        """Test descriptions read the key unless the config names an attr."""
+        from custom_components.nwp500.sensor import create_sensor_descriptions
+
+        by_key = {d.key: d for d in create_sensor_descriptions()}
+
+        assert by_key["dhw_temperature"].attr_name == "dhw_temperature"
+        assert by_key["dhw_temperature_2"].attr_name == "dhw_temperature2"
+        assert (
+            by_key["recirculation_temperature"].attr_name
+            == "recirc_temperature"
+        )
+
     def test_sensor_missing_value(
         self,
         mock_coordinator: MagicMock,
@@ -206,6 +228,37 @@ class TestNWP500Sensor:
         # Just verify the sensor can be created and accessed
         _ = sensor.native_value  # May be None or a value
 
+    def test_sensor_holds_back_insignificant_changes(
+        self,
+        mock_coordinator: MagicMock,
+        mock_device: MagicMock,
+        mock_device_status: MagicMock,
+    ):
+        """Small moves are only written once they add up to SIGNIFICANT_CHANGE."""
+        from custom_components.nwp500.sensor import create_sensor_descriptions
+
+        desc = next(
+            d
+            for d in create_sensor_descriptions()
+            if d.key == "tank_upper_temperature"
+        )
+        assert desc.significant_change == 0.5
+
+        mac_address = mock_device.device_info.mac_address
+        sensor = NWP500Sensor(mock_coordinator, mac_address, mock_device, desc)
+        sensor.async_write_ha_state = MagicMock()
+        device_data = mock_coordinator.data[mac_address]
+
+        writes = []
+        for step, value in enumerate((125.0, 125.2, 125.4, 125.6, 125.6)):
+            mock_device_status.tank_upper_temperature = value
+            device_data["last_update"] = 1234567891.0 + step
+            sensor._handle_coordinator_update()
+            writes.append(sensor.async_write_ha_state.call_count)
+
+        # Written first, held at +0.2 and +0.4, written once +0.6 is reached
+        assert writes == [1, 1, 1, 2, 2]
+
     def test_diagnostic_sensors(
         self,
         mock_coordinator: MagicMock,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.nwp500 import (
+    _COMMAND_SERVICES,
     ATTR_DAYS,
     ATTR_DEVICE_ID,
     ATTR_ENABLED,
@@ -195,7 +197,7 @@ class TestReservationServices:
 
         # Mock build_reservation_entry in the encoding module
         with patch(
-            "nwp500.encoding.build_reservation_entry",
+            "custom_components.nwp500.build_reservation_entry",
             return_value={
                 "enable": 1,
                 "week": 42,
@@ -276,7 +278,7 @@ class TestReservationServices:
 
         # Mock build_reservation_entry in the encoding module
         with patch(
-            "nwp500.encoding.build_reservation_entry",
+            "custom_components.nwp500.build_reservation_entry",
             return_value={
                 "enable": 1,
                 "week": 2,
@@ -428,7 +430,9 @@ class TestReservationServices:
             # ATTR_TEMPERATURE not provided
         }
 
-        with patch("nwp500.encoding.build_reservation_entry") as mock_build:
+        with patch(
+            "custom_components.nwp500.build_reservation_entry"
+        ) as mock_build:
             await set_reservation_handler(call)
 
             mock_build.assert_called_once()
@@ -616,6 +620,42 @@ class TestTouAndVacationServices:
             "AA:BB:CC:DD:EE:FF", "set_vacation_days", days=7
         )
 
+    @pytest.mark.asyncio
+    async def test_set_vacation_days_logs_readable_message(
+        self, mock_hass, mock_device_registry, caplog
+    ):
+        """Command services log their own message, not a kwargs dump."""
+        self.mock_coordinator.async_send_command = AsyncMock(return_value=True)
+
+        await _async_setup_services(mock_hass)
+        handler = next(
+            registered[0][2]
+            for registered in mock_hass.services.async_register.call_args_list
+            if registered[0][1] == SERVICE_SET_VACATION_DAYS
+        )
+        call = MagicMock(spec=ServiceCall)
+        call.data = {ATTR_DEVICE_ID: "device_123", ATTR_DAYS: 7}
+        with caplog.at_level(logging.INFO, logger="custom_components.nwp500"):
+            await handler(call)
+
+        assert (
+            "Setting vacation mode for 7 days on AA:BB:CC:DD:EE:FF"
+            in caplog.messages
+        )
+
+    def test_command_service_messages_match_their_arguments(self):
+        """Each log template takes the forwarded value, if any, and the MAC."""
+        for (
+            name,
+            _command,
+            field,
+            message,
+            _error,
+            _schema,
+        ) in _COMMAND_SERVICES:
+            args = (1, "AA:BB:CC:DD:EE:FF") if field else ("AA:BB:CC:DD:EE:FF",)
+            assert message % args, name
+
     @pytest.mark.asyncio
     async def test_set_vacation_days_raises_on_failure(
         self, mock_hass, mock_device_registry
@@ -1344,3 +1384,115 @@ class TestSetReservationPreservesGlobalSwitch:
 
         _, kwargs = coordinator.async_update_reservations.call_args
         assert kwargs["enabled"] is True
+
+
+class TestCoordinatorLookup:
+    """Tests for resolving a service target to its coordinator."""
+
+    @staticmethod
+    def _coordinator(mac_address: str) -> MagicMock:
+        coordinator = MagicMock(spec=NWP500DataUpdateCoordinator)
+        coordinator.data = {mac_address: {}}
+        coordinator.async_request_reservations = AsyncMock(return_value=True)
+        return coordinator
+
+    @staticmethod
+    async def _handler(mock_hass):
+        await _async_setup_services(mock_hass)
+        for registered in mock_hass.services.async_register.call_args_list:
+            if registered[0][1] == SERVICE_REQUEST_RESERVATIONS:
+                return registered[0][2]
+        raise AssertionError("request_reservations was not registered")
+
+    @staticmethod
+    def _target(mock_device_registry, mac_address: str) -> MagicMock:
+        device_entry = MagicMock()
+        device_entry.identifiers = {(DOMAIN, mac_address)}
+        mock_device_registry.async_get = MagicMock(return_value=device_entry)
+        call = MagicMock(spec=ServiceCall)
+        call.data = {ATTR_DEVICE_ID: "device_123"}
+        return call
+
+    @pytest.mark.asyncio
+    async def test_follows_a_reloaded_entry(
+        self, mock_hass, mock_device_registry
+    ):
+        """A reload replaces the coordinator; calls must reach the new one."""
+        old = self._coordinator("AA:BB:CC:DD:EE:FF")
+        mock_hass.data[DOMAIN]["entry_1"] = old
+        handler = await self._handler(mock_hass)
+        call = self._target(mock_device_registry, "AA:BB:CC:DD:EE:FF")
+
+        await handler(call)
+        new = self._coordinator("AA:BB:CC:DD:EE:FF")
+        mock_hass.data[DOMAIN]["entry_1"] = new
+        await handler(call)
+
+        old.async_request_reservations.assert_awaited_once()
+        new.async_request_reservations.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_finds_a_device_added_after_the_first_call(
+        self, mock_hass, mock_device_registry
+    ):
+        """A miss rebuilds the index rather than failing."""
+        mock_hass.data[DOMAIN]["entry_1"] = self._coordinator(
+            "AA:BB:CC:DD:EE:FF"
+        )
+        handler = await self._handler(mock_hass)
+        await handler(self._target(mock_device_registry, "AA:BB:CC:DD:EE:FF"))
+
+        second = self._coordinator("11:22:33:44:55:66")
+        mock_hass.data[DOMAIN]["entry_2"] = second
+        await handler(self._target(mock_device_registry, "11:22:33:44:55:66"))
+
+        second.async_request_reservations.assert_awaited_once()
+
+
+class TestServiceCommandsBurstPolling:
+    """Commands sent through services poll fast afterwards, like controls."""
+
+    @pytest.mark.asyncio
+    async def test_service_command_starts_burst_polling(
+        self, mock_hass, mock_device_registry
+    ):
+        """A successful service command starts the coordinator's burst."""
+        from datetime import timedelta
+
+        from custom_components.nwp500.const import (
+            BURST_CYCLES,
+            BURST_SCAN_INTERVAL,
+        )
+
+        mac = "AA:BB:CC:DD:EE:FF"
+        entry = MagicMock()
+        entry.options = {}
+        with patch(
+            "custom_components.nwp500.coordinator.DataUpdateCoordinator.__init__"
+        ):
+            coordinator = NWP500DataUpdateCoordinator(mock_hass, entry)
+        coordinator.data = {mac: {}}
+        coordinator._devices_by_mac = {mac: MagicMock()}
+        coordinator.mqtt_manager = MagicMock()
+        coordinator.mqtt_manager.send_command = AsyncMock(return_value=True)
+        mock_hass.data[DOMAIN]["entry_1"] = coordinator
+
+        device_entry = MagicMock()
+        device_entry.identifiers = {(DOMAIN, mac)}
+        mock_device_registry.async_get = MagicMock(return_value=device_entry)
+
+        await _async_setup_services(mock_hass)
+        handler = next(
+            registered[0][2]
+            for registered in mock_hass.services.async_register.call_args_list
+            if registered[0][1] == SERVICE_SET_VACATION_DAYS
+        )
+        call = MagicMock(spec=ServiceCall)
+        call.data = {ATTR_DEVICE_ID: "device_123", ATTR_DAYS: 7}
+        await handler(call)
+
+        coordinator.mqtt_manager.send_command.assert_awaited_once()
+        assert coordinator._burst_polls == BURST_CYCLES
+        assert coordinator._poll_interval == timedelta(
+            seconds=BURST_SCAN_INTERVAL
+        )